@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -18,18 +20,15 @@ _OUTCOME_STYLES: dict[Outcome, str] = {
 
 
 def _make_summary_table(results: list[TestFinished]) -> Table:
-    counts: dict[Outcome, int] = {}
-    total_duration = 0.0
-    for r in results:
-        counts[r.outcome] = counts.get(r.outcome, 0) + 1
-        total_duration += r.duration
+    counts = Counter(r.outcome for r in results)
+    total_duration = sum(r.duration for r in results)
 
     table = Table(title="Test Results Summary", show_edge=False)
     table.add_column("Outcome", style="bold")
     table.add_column("Count", justify="right")
 
     for outcome in Outcome:
-        count = counts.get(outcome, 0)
+        count = counts[outcome]
         if count == 0:
             continue
         style = _OUTCOME_STYLES.get(outcome, "")
@@ -63,9 +62,18 @@ def _make_failure_panels(results: list[TestFinished]) -> list[Panel]:
     return panels
 
 
+def stderr_console() -> Console:
+    """Return a Console for the current sys.stderr.
+
+    Built per call so terminal and color detection run against the stream in
+    effect now, e.g. after stderr has been redirected.
+    """
+    return Console(stderr=True)
+
+
 def print_results(results: list[TestFinished]) -> None:
     """Print a rich-formatted summary of test results to stderr."""
-    console = Console(stderr=True)
+    console = stderr_console()
 
     if not results:
         console.print("[yellow]No test results collected.[/yellow]")
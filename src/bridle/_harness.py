@@ -8,8 +8,8 @@ import tempfile
 from pathlib import Path
 
 from bridle._console import print_results
-from bridle._monitor import monitor_subprocess
-from bridle._schema import read_events, resolve_events
+from bridle._monitor import EventReader, monitor_subprocess
+from bridle._schema import resolve_events
 from bridle.backends import get_backends
 
 
@@ -79,16 +79,25 @@ def run(argv: list[str] | None = None) -> int:
             env["PYTHONPATH"] = (
                 source_root + os.pathsep + existing if existing else source_root
             )
-        proc = subprocess.Popen(
-            [python_exe, "-m", "bridle._runner", str(results_file), *pytest_args],
-            env=env,
-        )
-        exit_code, timeout_result = monitor_subprocess(
-            proc,
-            results_file,
-            test_timeout_sec=known.test_timeout_sec,
-            total_timeout_sec=known.total_timeout_sec,
-        )
+        # The monitor parses events as they are written, overlapping with
+        # the test run.
+        reader = EventReader(results_file)
+        try:
+            proc = subprocess.Popen(
+                [python_exe, "-m", "bridle._runner", str(results_file), *pytest_args],
+                env=env,
+            )
+            exit_code, timeout_result = monitor_subprocess(
+                proc,
+                results_file,
+                test_timeout_sec=known.test_timeout_sec,
+                total_timeout_sec=known.total_timeout_sec,
+                reader=reader,
+            )
+        finally:
+            # Read whatever events were written, even on crash.
+            events = reader.finish()
+
         if timeout_result is not None:
             if timeout_result.kind == "test":
                 print(
@@ -103,19 +112,16 @@ def run(argv: list[str] | None = None) -> int:
                     file=sys.stderr,
                 )
 
-        # Read whatever events were written, even on crash.
-        events = read_events(results_file)
-
         # Resolve started/finished pairs for display.
         resolved = resolve_events(events)
 
         # Display results.
         print_results(resolved)
 
-        # Upload raw events via backends.
+        # Upload raw events via backends, sharing the resolved results.
         if events:
             for backend in backends:
-                backend.upload(events)
+                backend.upload(events, resolved=resolved)
 
         return exit_code
     finally:
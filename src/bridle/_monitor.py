@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import ctypes
 import logging
+import math
+import os
+import select
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import BinaryIO, Iterator, Protocol, runtime_checkable
 
 from bridle._schema import (
     Outcome,
+    TestEvent,
     TestFinished,
     TestStarted,
     _event_adapter,
-    append_event,
+    append_events,
     test_timeout_repr,
     total_timeout_repr,
 )
@@ -42,6 +48,197 @@ class Process(Protocol):
     def wait(self, timeout: float | None = None) -> int: ...
 
 
+class _SleepWait:
+    """Fallback wait strategy: sleep until the next deadline or poll_interval."""
+
+    def __init__(self, clock: Clock, poll_interval: float) -> None:
+        self._clock = clock
+        self._poll_interval = poll_interval
+
+    def wait(self, timeout: float | None) -> None:
+        if timeout is None or timeout > self._poll_interval:
+            timeout = self._poll_interval
+        self._clock.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+# inotify event masks (see <sys/inotify.h>).
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+
+
+def _inotify_watch(path: Path) -> int | None:
+    """Return a non-blocking inotify fd watching *path* for writes, or None."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(path), _IN_MODIFY | _IN_CLOSE_WRITE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class _PidfdWait:
+    """Linux wait strategy: block on a pidfd plus an inotify watch.
+
+    Wakes up as soon as the child exits or the results file is written, or
+    when the timeout (the next deadline) expires, so an idle run costs no
+    wakeups at all. If the inotify watch is unavailable, waits are capped at
+    poll_interval so newly started tests are still noticed.
+    """
+
+    def __init__(self, pid: int, results_path: Path, poll_interval: float) -> None:
+        self._poll_interval = poll_interval
+        self._pidfd = os.pidfd_open(pid)
+        self._inotify_fd = _inotify_watch(results_path)
+        self._poller = select.poll()
+        self._poller.register(self._pidfd, select.POLLIN)
+        if self._inotify_fd is not None:
+            self._poller.register(self._inotify_fd, select.POLLIN)
+
+    def wait(self, timeout: float | None) -> None:
+        if self._inotify_fd is None:
+            timeout = (
+                self._poll_interval
+                if timeout is None
+                else min(timeout, self._poll_interval)
+            )
+        timeout_ms = None if timeout is None else max(0, math.ceil(timeout * 1000))
+        for fd, _ in self._poller.poll(timeout_ms):
+            if fd == self._inotify_fd:
+                self._drain_inotify()
+
+    def _drain_inotify(self) -> None:
+        assert self._inotify_fd is not None
+        try:
+            while os.read(self._inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self._pidfd)
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+
+
+def _make_wait(
+    proc: Process, results_path: Path, clock: Clock, poll_interval: float
+) -> _SleepWait | _PidfdWait:
+    """Pick the event-driven wait on Linux, falling back to sleeping."""
+    pid = getattr(proc, "pid", None)
+    if sys.platform == "linux" and hasattr(os, "pidfd_open") and isinstance(pid, int):
+        try:
+            return _PidfdWait(pid, results_path, poll_interval)
+        except OSError as exc:
+            logger.debug("pidfd wait unavailable, polling instead: %s", exc)
+    return _SleepWait(clock, poll_interval)
+
+
+class _Tail:
+    """Incrementally read complete JSONL lines appended to a file.
+
+    Keeps the file open between reads so each call only reads the bytes
+    written since the previous one. A trailing partial line stays buffered
+    until its newline arrives.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh: BinaryIO | None = None
+        self._buf = bytearray()
+        self._pos = 0
+
+    def read_lines(self) -> Iterator[bytes]:
+        if self._fh is None:
+            try:
+                self._fh = self.path.open("rb")
+            except FileNotFoundError:
+                return
+
+        # Idle polls are the common case: a single fstat() tells us the
+        # file hasn't grown without going through the read machinery.
+        if os.fstat(self._fh.fileno()).st_size <= self._pos:
+            return
+
+        data = self._fh.read()
+        if not data:
+            return
+        self._pos += len(data)
+
+        buf = self._buf
+        buf += data
+        start = 0
+        try:
+            while (nl := buf.find(b"\n", start)) >= 0:
+                yield bytes(buf[start:nl])
+                start = nl + 1
+        finally:
+            del buf[:start]
+
+    def remainder(self) -> bytes:
+        """Return the buffered partial line, if any."""
+        return bytes(self._buf)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+class EventReader:
+    """Incrementally parse events from the results file.
+
+    monitor_subprocess() calls read_new() each time it wakes up, so events
+    are parsed while pytest runs and every line is read and validated once.
+    When the subprocess exits, finish() only has the last few lines left.
+    Malformed lines are skipped with a warning, as in read_events().
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._tail = _Tail(path)
+        self._events: list[TestEvent] = []
+        self._lineno = 0
+
+    def read_new(self) -> list[TestEvent]:
+        """Parse newly appended complete lines and return their events."""
+        first = len(self._events)
+        for line in self._tail.read_lines():
+            self._parse(line)
+        return self._events[first:]
+
+    def finish(self) -> list[TestEvent]:
+        """Parse whatever is left and return all events."""
+        try:
+            self.read_new()
+            # A last line without a newline, e.g. cut short by a crash.
+            rest = self._tail.remainder()
+            if rest:
+                self._parse(rest)
+        finally:
+            self.close()
+        return self._events
+
+    def close(self) -> None:
+        self._tail.close()
+
+    def _parse(self, line: bytes) -> None:
+        self._lineno += 1
+        line = line.strip()
+        if not line:
+            return
+        try:
+            self._events.append(_event_adapter.validate_json(line))
+        except Exception as exc:
+            logger.warning("Skipping malformed line %d: %s", self._lineno, exc)
+
+
 @dataclass
 class TimeoutResult:
     """Information about a timeout that caused a process kill."""
@@ -58,37 +255,54 @@ def monitor_subprocess(
     *,
     test_timeout_sec: float | None = None,
     total_timeout_sec: float | None = None,
+    reader: EventReader | None = None,
     clock: Clock | None = None,
     poll_interval: float = 0.5,
 ) -> tuple[int, TimeoutResult | None]:
     """Monitor a subprocess, enforcing per-test and total timeouts.
 
+    The results file is tailed through reader; pass one to keep the events
+    it parses (call reader.finish() afterwards for the rest). Without
+    timeouts this just waits for the process while parsing events.
+
     Returns (exit_code, timeout_result). timeout_result is None if the process
     exited normally without hitting a timeout.
     """
+    wait: _SleepWait | _PidfdWait
     if clock is None:
         clock = WallClock()
+        wait = _make_wait(proc, results_path, clock, poll_interval)
+    else:
+        # An injected clock controls time, so sleep through it.
+        wait = _SleepWait(clock, poll_interval)
 
     run_start = clock.monotonic()
-    file_offset = 0  # byte offset for tailing the JSONL file
+    own_reader = reader is None
+    if reader is None:
+        reader = EventReader(results_path)
 
-    # Track active tests: nodeid -> (TestStarted, monotonic start time)
+    # Track active tests: nodeid -> (TestStarted, monotonic start time),
+    # in the order they started.
     active_tests: dict[str, tuple[TestStarted, float]] = {}
 
-    while True:
-        # Check if the process has exited.
-        exit_code = proc.poll()
-        if exit_code is not None:
-            return exit_code, None
-
-        # Tail new events from the JSONL file.
-        file_offset = _read_new_events(results_path, file_offset, active_tests, clock)
-
-        now = clock.monotonic()
-
-        # Check per-test timeout.
-        if test_timeout_sec is not None:
-            for nodeid, (started, mono_start) in list(active_tests.items()):
+    try:
+        while True:
+            # Check if the process has exited.
+            exit_code = proc.poll()
+            if exit_code is not None:
+                return exit_code, None
+
+            # Tail new events from the JSONL file.
+            _read_new_events(reader, active_tests, clock)
+
+            now = clock.monotonic()
+            deadlines: list[float] = []
+
+            # Check per-test timeout. active_tests is ordered by start time
+            # and the limit is the same for every test, so only the oldest
+            # active test can be the first to expire.
+            if test_timeout_sec is not None and active_tests:
+                nodeid, (_, mono_start) = next(iter(active_tests.items()))
                 elapsed = now - mono_start
                 if elapsed >= test_timeout_sec:
                     timeout = TimeoutResult(
@@ -100,57 +314,42 @@ def monitor_subprocess(
                     return _kill_and_record(
                         proc, results_path, active_tests, timeout, clock
                     )
+                deadlines.append(mono_start + test_timeout_sec)
 
-        # Check total timeout.
-        if total_timeout_sec is not None:
-            total_elapsed = now - run_start
-            if total_elapsed >= total_timeout_sec:
-                timeout = TimeoutResult(
-                    kind="total",
-                    nodeid=None,
-                    limit=total_timeout_sec,
-                    elapsed=total_elapsed,
-                )
-                return _kill_and_record(
-                    proc, results_path, active_tests, timeout, clock
-                )
+            # Check total timeout.
+            if total_timeout_sec is not None:
+                total_elapsed = now - run_start
+                if total_elapsed >= total_timeout_sec:
+                    timeout = TimeoutResult(
+                        kind="total",
+                        nodeid=None,
+                        limit=total_timeout_sec,
+                        elapsed=total_elapsed,
+                    )
+                    return _kill_and_record(
+                        proc, results_path, active_tests, timeout, clock
+                    )
+                deadlines.append(run_start + total_timeout_sec)
 
-        clock.sleep(poll_interval)
+            # Block until the next deadline (or an exit / file write).
+            wait.wait(min(deadlines) - now if deadlines else None)
+    finally:
+        wait.close()
+        if own_reader:
+            reader.close()
 
 
 def _read_new_events(
-    path: Path,
-    offset: int,
+    reader: EventReader,
     active_tests: dict[str, tuple[TestStarted, float]],
     clock: Clock,
-) -> int:
-    """Read new JSONL lines from offset, update active_tests. Returns new offset."""
-    try:
-        data = path.read_bytes()
-    except FileNotFoundError:
-        return offset
-
-    if len(data) <= offset:
-        return offset
-
-    new_bytes = data[offset:]
-    new_offset = len(data)
-
-    for line in new_bytes.decode("utf-8", errors="replace").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            event = _event_adapter.validate_json(line)
-        except Exception:
-            continue
-
-        if isinstance(event, TestStarted):
+) -> None:
+    """Parse newly appended events and update active_tests."""
+    for event in reader.read_new():
+        # Re-insert on start so the dict stays ordered by start time.
+        active_tests.pop(event.nodeid, None)
+        if event.type == "test_started":
             active_tests[event.nodeid] = (event, clock.monotonic())
-        elif isinstance(event, TestFinished):
-            active_tests.pop(event.nodeid, None)
-
-    return new_offset
 
 
 def _kill_and_record(
@@ -169,6 +368,7 @@ def _kill_and_record(
 
     now = clock.monotonic()
 
+    finished_events: list[TestEvent] = []
     for nodeid, (started, mono_start) in active_tests.items():
         elapsed = now - mono_start
         stop = started.start + elapsed
@@ -178,16 +378,20 @@ def _kill_and_record(
         else:
             longrepr = total_timeout_repr(timeout.limit, elapsed)
 
-        finished = TestFinished(
-            nodeid=nodeid,
-            outcome=Outcome.FAILED,
-            when="call",
-            duration=elapsed,
-            start=started.start,
-            stop=stop,
-            location=started.location,
-            longrepr=longrepr,
+        finished_events.append(
+            TestFinished(
+                nodeid=nodeid,
+                outcome=Outcome.FAILED,
+                when="call",
+                duration=elapsed,
+                start=started.start,
+                stop=stop,
+                location=started.location,
+                longrepr=longrepr,
+            )
         )
-        append_event(results_path, finished)
+
+    if finished_events:
+        append_events(results_path, finished_events)
 
     return exit_code, timeout
@@ -6,9 +6,9 @@ only needs pytest installed.  Plain dicts + stdlib json are used instead.
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
-from typing import IO
 
 import pytest
 
@@ -20,6 +20,12 @@ _OUTCOME_MAP: dict[str, str] = {
 }
 
 
+# Compact separators match the documented JSONL format and the output of
+# pydantic's model_dump_json(). Built once: json.dumps() with any non-default
+# option constructs a new encoder per call.
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
 def _map_outcome(report: pytest.TestReport) -> str:
     if hasattr(report, "wasxfail"):
         if report.passed:
@@ -29,24 +35,34 @@ def _map_outcome(report: pytest.TestReport) -> str:
 
 
 class TestResultPlugin:
-    """Pytest plugin that writes one JSONL line per test event, flushing immediately."""
+    """Pytest plugin that writes each test event as one unbuffered JSONL append."""
 
     def __init__(self, path: Path) -> None:
         self.path = path
-        self._file: IO[str] | None = None
+        self._fd: int | None = None
 
     def open(self) -> None:
-        self._file = self.path.open("w", encoding="utf-8")
+        # Unbuffered raw fd: each event normally reaches the file in one write(),
+        # so a crash never loses a completed line. O_APPEND keeps lines whole
+        # even if another writer shares the file.
+        self._fd = os.open(
+            self.path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | os.O_CLOEXEC,
+            0o644,
+        )
 
     def close(self) -> None:
-        if self._file is not None:
-            self._file.close()
-            self._file = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
     def _write(self, event: dict) -> None:
-        assert self._file is not None
-        self._file.write(json.dumps(event) + "\n")
-        self._file.flush()
+        assert self._fd is not None
+        # os.write may write only part of the buffer (signal, full disk);
+        # keep going so the harness never sees a truncated line.
+        view = memoryview((_encode(event) + "\n").encode("utf-8"))
+        while view:
+            view = view[os.write(self._fd, view):]
 
     # ---- pytest hooks ----
 
@@ -62,8 +78,10 @@ class TestResultPlugin:
         event = {
             "type": "test_started",
             "nodeid": nodeid,
+            # Epoch seconds as a float: the documented wire format.
+            # json.dumps writes the location tuple as a JSON array.
             "start": time.time(),
-            "location": list(location) if location is not None else None,
+            "location": location,
         }
         self._write(event)
 
@@ -96,7 +114,7 @@ class TestResultPlugin:
             "duration": round(report.duration, 6),
             "start": report.start,
             "stop": report.stop,
-            "location": list(report.location) if report.location is not None else None,
+            "location": report.location,
             "longrepr": longrepr,
             "sections": report.sections if report.sections else None,
             "wasxfail": getattr(report, "wasxfail", None),
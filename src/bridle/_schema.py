@@ -4,7 +4,7 @@ import json
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Literal, Union
+from typing import Annotated, Any, Literal, Union
 
 from pydantic import BaseModel, Field, TypeAdapter
 
@@ -50,23 +50,30 @@ class TestFinished(BaseModel):
 TestEvent = Annotated[Union[TestStarted, TestFinished], Field(discriminator="type")]
 _event_adapter: TypeAdapter[TestEvent] = TypeAdapter(TestEvent)
 
+# Compact JSON bytes for plain data (dicts, lists, enums, tuples), via
+# pydantic's serializer.
+to_json = TypeAdapter(Any).dump_json
+
 
 def read_events(path: Path) -> list[TestEvent]:
     """Read JSONL events file, skipping malformed/truncated lines."""
     events: list[TestEvent] = []
     try:
-        text = path.read_text(encoding="utf-8")
+        f = path.open("rb")
     except FileNotFoundError:
         return events
 
-    for lineno, line in enumerate(text.splitlines(), start=1):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(_event_adapter.validate_json(line))
-        except Exception as exc:
-            logger.warning("Skipping malformed line %d: %s", lineno, exc)
+    # Stream raw bytes line by line: validate_json parses bytes directly, so
+    # the file is never decoded or held in memory as one string.
+    with f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(_event_adapter.validate_json(line))
+            except Exception as exc:
+                logger.warning("Skipping malformed line %d: %s", lineno, exc)
 
     return events
 
@@ -74,31 +81,37 @@ def read_events(path: Path) -> list[TestEvent]:
 def resolve_events(events: list[TestEvent]) -> list[TestFinished]:
     """Match TestStarted/TestFinished pairs; synthesize failures for crashes.
 
-    Any TestStarted without a corresponding TestFinished is converted into a
-    synthetic TestFinished with outcome=FAILED, indicating a crash.
+    Any TestStarted without a later TestFinished for the same nodeid is
+    converted into a synthetic TestFinished with outcome=FAILED, indicating a
+    crash. Synthesized failures follow the real results.
     """
-    finished_nodeids: set[str] = set()
-    for ev in events:
-        if isinstance(ev, TestFinished):
-            finished_nodeids.add(ev.nodeid)
-
+    # Single pass: finished events are kept in order, and a start is
+    # pending until a TestFinished for the same nodeid arrives.
+    pending: dict[str, TestStarted] = {}
     resolved: list[TestFinished] = []
     for ev in events:
-        if isinstance(ev, TestFinished):
+        # Check the discriminator rather than isinstance(): it is a plain
+        # attribute compare on this hot loop.
+        if ev.type == "test_finished":
+            pending.pop(ev.nodeid, None)
             resolved.append(ev)
-        elif isinstance(ev, TestStarted) and ev.nodeid not in finished_nodeids:
-            resolved.append(
-                TestFinished(
-                    nodeid=ev.nodeid,
-                    outcome=Outcome.FAILED,
-                    when="call",
-                    duration=0.0,
-                    start=ev.start,
-                    stop=ev.start,
-                    location=ev.location,
-                    longrepr=CRASH_REPR,
-                )
+        else:
+            pending[ev.nodeid] = ev
+
+    # Starts left pending crashed; usually just the last test to run.
+    for ev in pending.values():
+        resolved.append(
+            TestFinished(
+                nodeid=ev.nodeid,
+                outcome=Outcome.FAILED,
+                when="call",
+                duration=0.0,
+                start=ev.start,
+                stop=ev.start,
+                location=ev.location,
+                longrepr=CRASH_REPR,
             )
+        )
 
     return resolved
 
@@ -109,6 +122,13 @@ def append_event(path: Path, event: TestEvent) -> None:
         f.write(json.dumps(event.model_dump()) + "\n")
 
 
+def append_events(path: Path, events: list[TestEvent]) -> None:
+    """Append several events to the JSONL file with a single write."""
+    data = b"".join(event.model_dump_json().encode("utf-8") + b"\n" for event in events)
+    with open(path, "ab") as f:
+        f.write(data)
+
+
 def test_timeout_repr(limit: float, elapsed: float) -> str:
     """Format longrepr for a per-test timeout kill."""
     return f"Test killed: exceeded per-test timeout of {limit:.1f}s (ran for {elapsed:.1f}s)"
@@ -1,31 +1,67 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 from bridle.backends._base import Backend
-from bridle.backends._buildkite import BuildkiteBackend
-from bridle.backends._mslci import MslciBackend
-from bridle.backends._stub import StubBackend
-
-_REGISTRY: dict[str, type[Backend]] = {
-    "stub": StubBackend,
-    "buildkite": BuildkiteBackend,
-    "mslci": MslciBackend,
+
+if TYPE_CHECKING:
+    from bridle.backends._buildkite import BuildkiteBackend
+    from bridle.backends._mslci import MslciBackend
+    from bridle.backends._stub import StubBackend
+
+# Backends are imported on first use so that selecting one backend does not
+# pay for the imports (urllib, http.client, ...) of the others.
+_REGISTRY: dict[str, str] = {
+    "stub": "bridle.backends._stub:StubBackend",
+    "buildkite": "bridle.backends._buildkite:BuildkiteBackend",
+    "mslci": "bridle.backends._mslci:MslciBackend",
 }
 
 
+def _load(target: str) -> type[Backend]:
+    mod_name, _, cls_name = target.partition(":")
+    return getattr(importlib.import_module(mod_name), cls_name)
+
+
 def get_backend(name: str) -> Backend:
     """Look up and instantiate a backend by name."""
-    cls = _REGISTRY.get(name)
-    if cls is None:
+    target = _REGISTRY.get(name)
+    if target is None:
         available = ", ".join(sorted(_REGISTRY))
         raise ValueError(
             f"Unknown backend {name!r}. Available backends: {available}"
         )
-    return cls()
+    return _load(target)()
 
 
 def get_backends(names: str) -> list[Backend]:
-    """Look up and instantiate backends from a comma-separated string."""
-    return [get_backend(n.strip()) for n in names.split(",")]
+    """Look up and instantiate backends from a comma-separated string.
+
+    Empty and repeated names are skipped, so each backend uploads once.
+    """
+    seen: set[str] = set()
+    backends: list[Backend] = []
+    for raw in names.split(","):
+        name = raw.strip()
+        if name and name not in seen:
+            seen.add(name)
+            backends.append(get_backend(name))
+    return backends
+
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "BuildkiteBackend": _REGISTRY["buildkite"],
+    "MslciBackend": _REGISTRY["mslci"],
+    "StubBackend": _REGISTRY["stub"],
+}
+
+
+def __getattr__(name: str) -> type[Backend]:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load(target)
 
 
 __all__ = ["Backend", "BuildkiteBackend", "MslciBackend", "StubBackend", "get_backend", "get_backends"]
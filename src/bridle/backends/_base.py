@@ -2,15 +2,24 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from bridle._schema import TestEvent
+from bridle._schema import TestEvent, TestFinished
 
 
 class Backend(ABC):
     """Abstract base class for test result upload backends."""
 
     @abstractmethod
-    def upload(self, events: list[TestEvent]) -> None:
-        """Upload test events to the backend."""
+    def upload(
+        self,
+        events: list[TestEvent],
+        resolved: list[TestFinished] | None = None,
+    ) -> None:
+        """Upload test events to the backend.
+
+        resolved, if given, is resolve_events(events) already computed by the
+        caller; backends that need resolved results should use it instead of
+        resolving again.
+        """
 
     @abstractmethod
     def name(self) -> str:
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import json
+import functools
+import itertools
 import logging
 import os
-import urllib.request
 import urllib.error
-from uuid import uuid4
-
-from bridle._schema import Outcome, TestEvent, TestFinished, resolve_events
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID, uuid4
+
+from bridle._schema import (
+    Outcome,
+    TestEvent,
+    TestFinished,
+    resolve_events,
+    to_json,
+)
 from bridle.backends._base import Backend
+from bridle.backends._http import HttpSession
 from bridle.backends._run_env import _detect_run_env
 
 logger = logging.getLogger(__name__)
@@ -38,24 +47,29 @@ def _parse_nodeid(nodeid: str) -> tuple[str, str, str]:
         "tests/test_a.py::TestClass::test_m"  -> ("tests/test_a.py", "TestClass", "test_m")
         "tests/test_a.py::test_p[1-2]"       -> ("tests/test_a.py", "tests/test_a.py", "test_p[1-2]")
     """
-    parts = nodeid.split("::")
-    file_name = parts[0]
-    if len(parts) == 3:
-        scope = parts[1]
-        name = parts[2]
-    elif len(parts) == 2:
-        scope = file_name
-        name = parts[1]
-    else:
-        scope = file_name
-        name = nodeid
-    return file_name, scope, name
-
-
-def _convert_event(event: TestFinished) -> dict:
-    """Convert a TestFinished event to a Buildkite test data dict."""
+    file_name, sep, rest = nodeid.partition("::")
+    if not sep:
+        return nodeid, nodeid, nodeid
+    # Parametrize ids are free-form and may themselves contain "::", so
+    # split them off before looking for the scope.
+    rest, bracket, params = rest.partition("[")
+    scope, sep, name = rest.partition("::")
+    if not sep:
+        return file_name, file_name, scope + bracket + params
+    if "::" in name:
+        # Deeper nesting (e.g. nested classes): fall back to the full nodeid.
+        return file_name, file_name, nodeid
+    return file_name, scope, name + bracket + params
+
+
+def _convert_event(event: TestFinished, entry_id: str | None = None) -> dict:
+    """Convert a TestFinished event to a Buildkite test data dict.
+
+    entry_id defaults to a fresh random UUID; upload() passes cheaper ids
+    derived from one random base per run.
+    """
     file_name, scope, name = _parse_nodeid(event.nodeid)
-    result = _map_outcome(event.outcome)
+    result = _OUTCOME_MAP[event.outcome]
 
     location_str: str | None = None
     if event.location is not None:
@@ -66,7 +80,7 @@ def _convert_event(event: TestFinished) -> dict:
             location_str = loc_file
 
     entry: dict = {
-        "id": str(uuid4()),
+        "id": entry_id if entry_id is not None else str(uuid4()),
         "scope": scope,
         "name": name,
         "identifier": event.nodeid,
@@ -89,35 +103,38 @@ def _convert_event(event: TestFinished) -> dict:
 
 
 def _post_batch(
-    api_url: str, token: str, run_env: dict, data: list[dict]
+    api_url: str,
+    token: str,
+    run_env_json: bytes,
+    data: Sequence[dict],
+    *,
+    session: HttpSession,
 ) -> None:
-    """POST a batch of test data to Buildkite."""
-    payload = json.dumps(
-        {
-            "format": "json",
-            "run_env": run_env,
-            "data": data,
-        }
-    ).encode("utf-8")
-
-    req = urllib.request.Request(
-        api_url,
-        data=payload,
-        headers={
-            "Authorization": f"Token token=\"{token}\"",
-            "Content-Type": "application/json",
-        },
-        method="POST",
+    """POST a batch of test data to Buildkite.
+
+    run_env_json is the pre-serialized run_env object, shared by all batches.
+    """
+    payload = (
+        b'{"format":"json","run_env":'
+        + run_env_json
+        + b',"data":'
+        + to_json(data)
+        + b"}"
     )
 
+    headers = {
+        "Authorization": f"Token token=\"{token}\"",
+        "Content-Type": "application/json",
+    }
+
     try:
-        with urllib.request.urlopen(req) as resp:
-            resp.read()
+        session.post(api_url, payload, headers)
     except (urllib.error.URLError, OSError) as exc:
         logger.warning("Buildkite upload failed: %s", exc)
 
 
 _BATCH_SIZE = 100
+_MAX_WORKERS = 4  # concurrent batch uploads
 
 
 class BuildkiteBackend(Backend):
@@ -126,7 +143,11 @@ class BuildkiteBackend(Backend):
     def name(self) -> str:
         return "buildkite"
 
-    def upload(self, events: list[TestEvent]) -> None:
+    def upload(
+        self,
+        events: list[TestEvent],
+        resolved: list[TestFinished] | None = None,
+    ) -> None:
         token = os.environ.get("BUILDKITE_ANALYTICS_TOKEN")
         if not token:
             logger.warning(
@@ -134,14 +155,35 @@ class BuildkiteBackend(Backend):
             )
             return
 
-        resolved = resolve_events(events)
+        if resolved is None:
+            resolved = resolve_events(events)
         if not resolved:
             return
 
         api_url = os.environ.get("BUILDKITE_ANALYTICS_API_URL", _DEFAULT_API_URL)
-        run_env = _detect_run_env()
-        data = [_convert_event(ev) for ev in resolved]
-
-        for i in range(0, len(data), _BATCH_SIZE):
-            batch = data[i : i + _BATCH_SIZE]
-            _post_batch(api_url, token, run_env, batch)
+        run_env_json = to_json(_detect_run_env())
+        # XOR a counter into the low (node) bits of one random UUID: ids stay
+        # unique and UUID-shaped without a urandom syscall per event.
+        base = uuid4().int
+        # Convert and batch in one pass. All batches are built up front: the
+        # pool is sized by their count and pool.map() submits them all anyway.
+        batches = list(
+            itertools.batched(
+                (
+                    _convert_event(ev, str(UUID(int=base ^ i)))
+                    for i, ev in enumerate(resolved)
+                ),
+                _BATCH_SIZE,
+            )
+        )
+
+        # Batches are independent, so overlap their round-trips; the session
+        # keeps each worker's connection alive across its batches.
+        with (
+            HttpSession() as session,
+            ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(batches))) as pool,
+        ):
+            post = functools.partial(
+                _post_batch, api_url, token, run_env_json, session=session
+            )
+            list(pool.map(post, batches))
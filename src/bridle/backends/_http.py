@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import http.client
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from types import TracebackType
+
+
+def _proxied(scheme: str, host: str) -> bool:
+    """Whether the environment routes requests for this host via a proxy."""
+    proxies = urllib.request.getproxies()
+    return scheme in proxies and not urllib.request.proxy_bypass(host)
+
+
+class HttpSession:
+    """Keep-alive HTTP client for uploading several batches to one host.
+
+    urllib.request opens and closes a connection for every request. This
+    session keeps one http.client connection per (thread, host) and reuses
+    it, so a multi-batch upload pays the TCP/TLS handshake once per worker
+    thread. Errors are raised as urllib.error.HTTPError / URLError, matching
+    urlopen. Requests that the environment routes through a proxy fall back
+    to urlopen.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_conns: list[http.client.HTTPConnection] = []
+
+    def __enter__(self) -> HttpSession:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conns: dict[tuple[str, str], http.client.HTTPConnection] | None = getattr(
+            self._local, "conns", None
+        )
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get((scheme, netloc))
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self._timeout)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=self._timeout)
+            conns[(scheme, netloc)] = conn
+            with self._lock:
+                self._all_conns.append(conn)
+        return conn
+
+    def post(self, url: str, body: bytes, headers: dict[str, str]) -> bytes:
+        """POST body to url and return the response body."""
+        parts = urllib.parse.urlsplit(url)
+        if _proxied(parts.scheme, parts.hostname or ""):
+            req = urllib.request.Request(
+                url, data=body, headers=headers, method="POST"
+            )
+            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
+                return resp.read()
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn = self._connection(parts.scheme, parts.netloc)
+        # A reused connection may have been closed by the server while idle;
+        # in that case reconnect and send once more.
+        reused = conn.sock is not None
+        while True:
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                # RemoteDisconnected is a ConnectionResetError.
+                if reused and isinstance(exc, (ConnectionResetError, BrokenPipeError)):
+                    reused = False
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            break
+
+        if resp.will_close:
+            conn.close()
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(
+                url, resp.status, resp.reason, resp.headers, None
+            )
+        return data
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._all_conns = self._all_conns, []
+        for conn in conns:
+            conn.close()
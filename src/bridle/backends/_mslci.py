@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
+import functools
+import gzip
 import logging
 import os
+import time
 import urllib.error
-import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-from bridle._schema import TestEvent, TestFinished, resolve_events
+from bridle._schema import TestEvent, TestFinished, resolve_events, to_json
 from bridle.backends._base import Backend
+from bridle.backends._http import HttpSession
 from bridle.backends._run_env import _detect_run_env
 
 logger = logging.getLogger(__name__)
@@ -25,12 +29,15 @@ def _location_to_str(
     return file
 
 
-def _make_mslci_run_env(raw: dict) -> dict:
+@functools.lru_cache(maxsize=1)
+def _make_mslci_run_env() -> dict:
     """Remap _detect_run_env() output to the MSLCI RunEnv schema.
 
     The server expects ``commit_sha`` (not ``commit``) and ``ci`` (not ``CI``).
-    Extra fields like ``number`` and ``message`` are dropped.
+    Extra fields like ``number`` and ``message`` are dropped. Cached like
+    _detect_run_env(); callers must not mutate the returned dict.
     """
+    raw = _detect_run_env()
     return {
         "key": raw.get("key", ""),
         "branch": raw.get("branch"),
@@ -45,37 +52,91 @@ def _serialize_event(
     event: TestFinished,
     exclude: set[str] | None = None,
 ) -> dict:
-    """Serialize a TestFinished event for the MSLCI upload payload."""
-    data = event.model_dump(exclude=exclude or {"type"})
+    """Serialize a TestFinished event for the MSLCI upload payload.
+
+    Fields are copied straight from the validated model's ``__dict__``, which
+    is markedly faster than model_dump() for these flat models; to_json()
+    takes care of enums and tuples.
+    """
+    exclude = exclude or {"type"}
+    data = {k: v for k, v in event.__dict__.items() if k not in exclude}
     # Convert location from tuple to string for the server schema.
     data["location"] = _location_to_str(event.location)
     return data
 
 
-_BATCH_SIZE = 5000
+_BATCH_SIZE = 5000  # max events per request
+_MAX_BATCH_BYTES = 4 * 1024 * 1024  # max serialized events per request
+_MAX_WORKERS = 8  # concurrent batch uploads
+_MAX_ATTEMPTS = 2  # per batch, for connection errors
+_RETRY_DELAY = 0.5  # seconds before retrying a batch
+
+
+def _batches(encoded: Iterable[bytes]) -> Iterator[list[bytes]]:
+    """Group JSON-encoded events into batches bounded by count and size.
+
+    A batch closes when it holds _BATCH_SIZE events or adding the next event
+    would take it past _MAX_BATCH_BYTES. An event larger than the byte limit
+    is sent in a batch of its own.
+    """
+    batch: list[bytes] = []
+    size = 0
+    for item in encoded:
+        if batch and (
+            len(batch) >= _BATCH_SIZE or size + len(item) > _MAX_BATCH_BYTES
+        ):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(item)
+        size += len(item) + 1  # plus the separating comma
+    if batch:
+        yield batch
+
+
+def _is_connection_error(exc: OSError) -> bool:
+    """Whether the connection failed, rather than e.g. timing out on a reply.
+
+    Refused, reset and broken connections (including a stale keep-alive
+    connection) are safe to retry. After a read timeout the server may
+    already have accepted the batch, so retrying could upload it twice.
+    """
+    if isinstance(exc, urllib.error.URLError):
+        return isinstance(exc.reason, ConnectionError)
+    return isinstance(exc, ConnectionError)
 
 
 def _post_batch(
     api_url: str,
     headers: dict[str, str],
-    run_env: dict,
-    data: list[dict],
+    run_env_json: bytes,
+    data: list[bytes],
+    *,
+    session: HttpSession,
+    compress: bool = False,
 ) -> None:
-    """POST a batch of serialized events to the MSLCI server."""
-    payload = json.dumps({"run_env": run_env, "events": data}).encode("utf-8")
-
-    req = urllib.request.Request(
-        api_url,
-        data=payload,
-        headers=headers,
-        method="POST",
+    """POST a batch of JSON-encoded events to the MSLCI server."""
+    payload = (
+        b'{"run_env":' + run_env_json + b',"events":[' + b",".join(data) + b"]}"
     )
-
-    try:
-        with urllib.request.urlopen(req) as resp:
-            resp.read()
-    except (urllib.error.URLError, OSError) as exc:
-        logger.warning("MSLCI upload failed: %s", exc)
+    if compress:
+        # Level 1 gets most of the ratio on repetitive JSON at a fraction
+        # of the CPU cost of the default level.
+        payload = gzip.compress(payload, compresslevel=1)
+
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            session.post(api_url, payload, headers)
+            return
+        except urllib.error.HTTPError as exc:
+            # The server answered; sending the same batch again won't help.
+            logger.warning("MSLCI upload failed: %s", exc)
+            return
+        except (urllib.error.URLError, OSError) as exc:
+            if attempt == _MAX_ATTEMPTS or not _is_connection_error(exc):
+                logger.warning("MSLCI upload failed: %s", exc)
+                return
+            time.sleep(_RETRY_DELAY)
 
 
 class MslciBackend(Backend):
@@ -84,13 +145,18 @@ class MslciBackend(Backend):
     def name(self) -> str:
         return "mslci"
 
-    def upload(self, events: list[TestEvent]) -> None:
+    def upload(
+        self,
+        events: list[TestEvent],
+        resolved: list[TestFinished] | None = None,
+    ) -> None:
         api_url = os.environ.get("MSLCI_API_URL")
         if not api_url:
             logger.warning("MSLCI_API_URL not set; skipping MSLCI upload")
             return
 
-        resolved = resolve_events(events)
+        if resolved is None:
+            resolved = resolve_events(events)
         if not resolved:
             return
 
@@ -99,14 +165,37 @@ class MslciBackend(Backend):
         if exclude_env:
             exclude |= {f.strip() for f in exclude_env.split(",") if f.strip()}
 
-        run_env = _make_mslci_run_env(_detect_run_env())
-        data = [_serialize_event(ev, exclude=exclude) for ev in resolved]
+        run_env_json = to_json(_make_mslci_run_env())
 
         headers: dict[str, str] = {"Content-Type": "application/json"}
         token = os.environ.get("MSLCI_API_TOKEN")
         if token:
             headers["Authorization"] = f'Token token="{token}"'
-
-        for i in range(0, len(data), _BATCH_SIZE):
-            batch = data[i : i + _BATCH_SIZE]
-            _post_batch(api_url, headers, run_env, batch)
+        # The server must accept gzip request bodies, so this is opt-in.
+        compress = os.environ.get("MSLCI_COMPRESS") == "1"
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+
+        # Serialize, encode and batch in one pass; encoding up front lets
+        # batches be sized in bytes.
+        batches = list(
+            _batches(
+                to_json(_serialize_event(ev, exclude=exclude)) for ev in resolved
+            )
+        )
+
+        # Batches are independent, so overlap their round-trips; a failed
+        # batch is logged without affecting the others.
+        with (
+            HttpSession() as session,
+            ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(batches))) as pool,
+        ):
+            post = functools.partial(
+                _post_batch,
+                api_url,
+                headers,
+                run_env_json,
+                session=session,
+                compress=compress,
+            )
+            list(pool.map(post, batches))
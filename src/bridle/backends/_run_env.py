@@ -1,45 +1,71 @@
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Callable, Mapping
 
 
-def _detect_run_env() -> dict:
-    """Detect CI environment from env vars."""
-    env = os.environ
+def _buildkite_env(env: Mapping[str, str]) -> dict:
+    return {
+        "CI": "buildkite",
+        "key": env.get("BUILDKITE_BUILD_ID", ""),
+        "number": env.get("BUILDKITE_BUILD_NUMBER", ""),
+        "job_id": env.get("BUILDKITE_JOB_ID", ""),
+        "branch": env.get("BUILDKITE_BRANCH", ""),
+        "commit": env.get("BUILDKITE_COMMIT", ""),
+        "message": env.get("BUILDKITE_MESSAGE", ""),
+        "url": env.get("BUILDKITE_BUILD_URL", ""),
+    }
+
+
+def _github_actions_env(env: Mapping[str, str]) -> dict:
+    run_id = env.get("GITHUB_RUN_ID", "")
+    return {
+        "CI": "github_actions",
+        "key": f"{run_id}-{env.get('GITHUB_RUN_ATTEMPT', '1')}",
+        "number": env.get("GITHUB_RUN_NUMBER", ""),
+        "branch": env.get("GITHUB_REF", ""),
+        "commit": env.get("GITHUB_SHA", ""),
+        "url": f"{env.get('GITHUB_SERVER_URL', '')}/{env.get('GITHUB_REPOSITORY', '')}/actions/runs/{run_id}",
+    }
 
-    if env.get("BUILDKITE_BUILD_ID"):
-        return {
-            "CI": "buildkite",
-            "key": env.get("BUILDKITE_BUILD_ID", ""),
-            "number": env.get("BUILDKITE_BUILD_NUMBER", ""),
-            "job_id": env.get("BUILDKITE_JOB_ID", ""),
-            "branch": env.get("BUILDKITE_BRANCH", ""),
-            "commit": env.get("BUILDKITE_COMMIT", ""),
-            "message": env.get("BUILDKITE_MESSAGE", ""),
-            "url": env.get("BUILDKITE_BUILD_URL", ""),
-        }
-
-    if env.get("GITHUB_ACTION"):
-        return {
-            "CI": "github_actions",
-            "key": f"{env.get('GITHUB_RUN_ID', '')}-{env.get('GITHUB_RUN_ATTEMPT', '1')}",
-            "number": env.get("GITHUB_RUN_NUMBER", ""),
-            "branch": env.get("GITHUB_REF", ""),
-            "commit": env.get("GITHUB_SHA", ""),
-            "url": f"{env.get('GITHUB_SERVER_URL', '')}/{env.get('GITHUB_REPOSITORY', '')}/actions/runs/{env.get('GITHUB_RUN_ID', '')}",
-        }
-
-    if env.get("CIRCLE_BUILD_NUM"):
-        return {
-            "CI": "circleci",
-            "key": env.get("CIRCLE_WORKFLOW_ID", ""),
-            "number": env.get("CIRCLE_BUILD_NUM", ""),
-            "branch": env.get("CIRCLE_BRANCH", ""),
-            "commit": env.get("CIRCLE_SHA1", ""),
-            "url": env.get("CIRCLE_BUILD_URL", ""),
-        }
 
+def _circleci_env(env: Mapping[str, str]) -> dict:
+    return {
+        "CI": "circleci",
+        "key": env.get("CIRCLE_WORKFLOW_ID", ""),
+        "number": env.get("CIRCLE_BUILD_NUM", ""),
+        "branch": env.get("CIRCLE_BRANCH", ""),
+        "commit": env.get("CIRCLE_SHA1", ""),
+        "url": env.get("CIRCLE_BUILD_URL", ""),
+    }
+
+
+def _generic_env(env: Mapping[str, str]) -> dict:
     return {
         "CI": "generic",
         "key": env.get("CI_BUILD_ID", ""),
     }
+
+
+# (marker variable, builder), checked in order; a provider is detected when
+# its marker is set to a non-empty value.
+_DETECTORS: tuple[tuple[str, Callable[[Mapping[str, str]], dict]], ...] = (
+    ("BUILDKITE_BUILD_ID", _buildkite_env),
+    ("GITHUB_ACTION", _github_actions_env),
+    ("CIRCLE_BUILD_NUM", _circleci_env),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_run_env() -> dict:
+    """Detect CI environment from env vars.
+
+    The CI environment does not change within a process, so the result is
+    cached. Callers must not mutate the returned dict.
+    """
+    env = os.environ
+    for marker, build in _DETECTORS:
+        if env.get(marker):
+            return build(env)
+    return _generic_env(env)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from rich.console import Console
+from collections import Counter
 
-from bridle._schema import TestEvent, TestFinished, TestStarted
+from bridle._console import stderr_console
+from bridle._schema import TestEvent, TestFinished
 from bridle.backends._base import Backend
 
 
@@ -12,11 +13,15 @@ class StubBackend(Backend):
     def name(self) -> str:
         return "stub"
 
-    def upload(self, events: list[TestEvent]) -> None:
-        started = sum(1 for e in events if isinstance(e, TestStarted))
-        finished = sum(1 for e in events if isinstance(e, TestFinished))
-        console = Console(stderr=True)
-        console.print(
+    def upload(
+        self,
+        events: list[TestEvent],
+        resolved: list[TestFinished] | None = None,
+    ) -> None:
+        counts = Counter(e.type for e in events)
+        started = counts["test_started"]
+        finished = counts["test_finished"]
+        stderr_console().print(
             f"[dim]StubBackend: would upload {len(events)} event(s) "
             f"({started} started, {finished} finished)[/dim]"
         )
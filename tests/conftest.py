@@ -3,6 +3,8 @@ from __future__ import annotations
 import pytest
 
 from bridle._schema import Outcome, TestFinished
+from bridle.backends._mslci import _make_mslci_run_env
+from bridle.backends._run_env import _detect_run_env
 
 pytest_plugins = ["pytester"]
 
@@ -11,6 +13,13 @@ FIXED_START = 1735689600.0  # 2025-01-01T00:00:00 UTC
 FIXED_STOP = 1735689600.005  # 5ms later
 
 
+@pytest.fixture(autouse=True)
+def _clear_run_env_cache() -> None:
+    """Tests change CI env vars, so drop the per-process run env caches."""
+    _detect_run_env.cache_clear()
+    _make_mslci_run_env.cache_clear()
+
+
 @pytest.fixture()
 def sample_results() -> list[TestFinished]:
     return [
@@ -0,0 +1,3 @@
+import time
+def test_hangs():
+    time.sleep(60)
@@ -0,0 +1,5 @@
+import time
+def test_a():
+    time.sleep(60)
+def test_b():
+    time.sleep(60)
@@ -0,0 +1,11 @@
+import pytest
+
+def test_pass():
+    assert True
+
+def test_fail():
+    assert False
+
+@pytest.mark.skip
+def test_skip():
+    pass
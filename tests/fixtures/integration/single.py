@@ -0,0 +1,2 @@
+def test_ok():
+    pass
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import subprocess
+import sys
+import threading
 import urllib.error
+import uuid
+from collections.abc import Iterator, Sequence
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,11 +26,15 @@ from bridle.backends import (
     get_backends,
 )
 from bridle.backends._buildkite import (
+    _OUTCOME_MAP,
     _convert_event,
     _map_outcome,
     _parse_nodeid,
+    _post_batch,
 )
-from bridle.backends._run_env import _detect_run_env
+from bridle.backends._http import HttpSession
+from bridle.backends._mslci import _batches
+from bridle.backends._run_env import _DETECTORS, _detect_run_env
 
 # Deterministic timestamps reused from conftest.
 FIXED_START = 1735689600.0
@@ -65,6 +78,27 @@ class TestGetBackends:
         with pytest.raises(ValueError, match="Unknown backend 'nope'"):
             get_backends("stub,nope")
 
+    def test_duplicates_removed(self) -> None:
+        backends = get_backends("stub,buildkite,stub, buildkite")
+        assert len(backends) == 2
+        assert isinstance(backends[0], StubBackend)
+        assert isinstance(backends[1], BuildkiteBackend)
+
+    def test_empty_names_skipped(self) -> None:
+        backends = get_backends("stub,")
+        assert len(backends) == 1
+
+    def test_unused_backends_not_imported(self) -> None:
+        code = (
+            "import sys\n"
+            "from bridle.backends import get_backends\n"
+            "get_backends('stub')\n"
+            "assert 'bridle.backends._stub' in sys.modules\n"
+            "assert 'bridle.backends._buildkite' not in sys.modules\n"
+            "assert 'bridle.backends._mslci' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_whitespace_handling(self) -> None:
         backends = get_backends("stub, buildkite")
         assert len(backends) == 2
@@ -101,6 +135,9 @@ class TestMapOutcome:
     def test_all_outcomes(self, outcome: Outcome, expected: str) -> None:
         assert _map_outcome(outcome) == expected
 
+    def test_map_covers_every_outcome(self) -> None:
+        assert _OUTCOME_MAP.keys() == set(Outcome)
+
 
 class TestParseNodeid:
     def test_function_level(self) -> None:
@@ -125,6 +162,32 @@ class TestParseNodeid:
         assert scope == "tests/test_a.py"
         assert name == "test_param[1-2]"
 
+    def test_parametrized_with_colons(self) -> None:
+        assert _parse_nodeid("tests/test_a.py::test_bar[::]") == (
+            "tests/test_a.py",
+            "tests/test_a.py",
+            "test_bar[::]",
+        )
+        assert _parse_nodeid("tests/test_a.py::TestC::test_bar[a::b]") == (
+            "tests/test_a.py",
+            "TestC",
+            "test_bar[a::b]",
+        )
+
+    def test_nested_class_uses_full_nodeid(self) -> None:
+        nodeid = "tests/test_a.py::TestOuter::TestInner::test_m"
+        file_name, scope, name = _parse_nodeid(nodeid)
+        assert file_name == "tests/test_a.py"
+        assert scope == "tests/test_a.py"
+        assert name == nodeid
+
+    def test_file_only(self) -> None:
+        assert _parse_nodeid("tests/test_a.py") == (
+            "tests/test_a.py",
+            "tests/test_a.py",
+            "tests/test_a.py",
+        )
+
 
 class TestConvertEvent:
     def test_passed_event(self) -> None:
@@ -138,6 +201,7 @@ class TestConvertEvent:
             location=("tests/test_a.py", 10, "test_ok"),
         )
         result = _convert_event(event)
+        assert str(uuid.UUID(result["id"])) == result["id"]
         assert result["result"] == "passed"
         assert result["name"] == "test_ok"
         assert result["scope"] == "tests/test_a.py"
@@ -191,49 +255,87 @@ class TestConvertEvent:
         assert result["location"] is None
 
 
+@pytest.fixture()
+def clean_ci_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Remove CI provider markers so tests see only the env they set."""
+    for name, _ in _DETECTORS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
 class TestDetectRunEnv:
-    def test_buildkite(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("BUILDKITE_BUILD_ID", "abc-123")
-        monkeypatch.setenv("BUILDKITE_BUILD_NUMBER", "42")
-        monkeypatch.setenv("BUILDKITE_BRANCH", "main")
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            pytest.param(
+                {
+                    "BUILDKITE_BUILD_ID": "abc-123",
+                    "BUILDKITE_BUILD_NUMBER": "42",
+                    "BUILDKITE_BRANCH": "main",
+                },
+                {"CI": "buildkite", "key": "abc-123", "number": "42", "branch": "main"},
+                id="buildkite",
+            ),
+            pytest.param(
+                {
+                    "GITHUB_ACTION": "run",
+                    "GITHUB_RUN_ID": "999",
+                    "GITHUB_RUN_NUMBER": "5",
+                    "GITHUB_SHA": "deadbeef",
+                    "GITHUB_REF": "refs/heads/main",
+                    "GITHUB_SERVER_URL": "https://github.com",
+                    "GITHUB_REPOSITORY": "org/repo",
+                    "GITHUB_RUN_ATTEMPT": "1",
+                },
+                {"CI": "github_actions", "key": "999-1", "commit": "deadbeef"},
+                id="github_actions",
+            ),
+            pytest.param(
+                {
+                    "CIRCLE_BUILD_NUM": "77",
+                    "CIRCLE_BRANCH": "develop",
+                    "CIRCLE_SHA1": "cafebabe",
+                },
+                {"CI": "circleci", "number": "77", "branch": "develop"},
+                id="circleci",
+            ),
+            pytest.param({}, {"CI": "generic"}, id="generic_fallback"),
+        ],
+    )
+    def test_detects_provider(
+        self,
+        clean_ci_env: pytest.MonkeyPatch,
+        env: dict[str, str],
+        expected: dict[str, str],
+    ) -> None:
+        for name, value in env.items():
+            clean_ci_env.setenv(name, value)
         result = _detect_run_env()
-        assert result["CI"] == "buildkite"
-        assert result["key"] == "abc-123"
-        assert result["number"] == "42"
-        assert result["branch"] == "main"
+        assert {k: result[k] for k in expected} == expected
 
-    def test_github_actions(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("BUILDKITE_BUILD_ID", raising=False)
-        monkeypatch.setenv("GITHUB_ACTION", "run")
-        monkeypatch.setenv("GITHUB_RUN_ID", "999")
-        monkeypatch.setenv("GITHUB_RUN_NUMBER", "5")
-        monkeypatch.setenv("GITHUB_SHA", "deadbeef")
-        monkeypatch.setenv("GITHUB_REF", "refs/heads/main")
-        monkeypatch.setenv("GITHUB_SERVER_URL", "https://github.com")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "org/repo")
-        monkeypatch.setenv("GITHUB_RUN_ATTEMPT", "1")
-        result = _detect_run_env()
-        assert result["CI"] == "github_actions"
-        assert result["key"] == "999-1"
-        assert result["commit"] == "deadbeef"
 
-    def test_circleci(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("BUILDKITE_BUILD_ID", raising=False)
-        monkeypatch.delenv("GITHUB_ACTION", raising=False)
-        monkeypatch.setenv("CIRCLE_BUILD_NUM", "77")
-        monkeypatch.setenv("CIRCLE_BRANCH", "develop")
-        monkeypatch.setenv("CIRCLE_SHA1", "cafebabe")
-        result = _detect_run_env()
-        assert result["CI"] == "circleci"
-        assert result["number"] == "77"
-        assert result["branch"] == "develop"
+class _BuildkitePost(NamedTuple):
+    api_url: str
+    token: str
+    data: list[dict[str, object]]
 
-    def test_generic_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("BUILDKITE_BUILD_ID", raising=False)
-        monkeypatch.delenv("GITHUB_ACTION", raising=False)
-        monkeypatch.delenv("CIRCLE_BUILD_NUM", raising=False)
-        result = _detect_run_env()
-        assert result["CI"] == "generic"
+
+@pytest.fixture()
+def buildkite_posts() -> Iterator[list[_BuildkitePost]]:
+    """Record Buildkite batch posts in a list instead of sending them."""
+    posts: list[_BuildkitePost] = []
+
+    def _record(
+        api_url: str,
+        token: str,
+        run_env_json: bytes,
+        data: Sequence[dict[str, object]],
+        **kwargs: object,
+    ) -> None:
+        posts.append(_BuildkitePost(api_url, token, list(data)))
+
+    with patch("bridle.backends._buildkite._post_batch", new=_record):
+        yield posts
 
 
 class TestBuildkiteUpload:
@@ -246,32 +348,46 @@ class TestBuildkiteUpload:
             backend.upload([])
         assert "BUILDKITE_ANALYTICS_TOKEN not set" in caplog.text
 
-    def test_empty_events_no_upload(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_empty_events_no_upload(
+        self, monkeypatch: pytest.MonkeyPatch, buildkite_posts: list[_BuildkitePost]
+    ) -> None:
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
         backend = BuildkiteBackend()
-        with patch(
-            "bridle.backends._buildkite._post_batch"
-        ) as mock_post:
-            backend.upload([])
-            mock_post.assert_not_called()
+        backend.upload([])
+        assert buildkite_posts == []
 
     def test_correct_payload_structure(
-        self, monkeypatch: pytest.MonkeyPatch, sample_results: list[TestFinished]
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_results: list[TestFinished],
+        buildkite_posts: list[_BuildkitePost],
     ) -> None:
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
         backend = BuildkiteBackend()
-        with patch(
-            "bridle.backends._buildkite._post_batch"
-        ) as mock_post:
-            backend.upload(sample_results)
-            mock_post.assert_called_once()
-            args = mock_post.call_args
-            assert args[0][0] == "https://analytics-api.buildkite.com/v1/uploads"
-            assert args[0][1] == "fake-token"
-            data = args[0][3]
-            assert len(data) == 3
-            results = [d["result"] for d in data]
-            assert results == ["passed", "failed", "skipped"]
+        backend.upload(sample_results)
+        [post] = buildkite_posts
+        assert post.api_url == "https://analytics-api.buildkite.com/v1/uploads"
+        assert post.token == "fake-token"
+        results = [d["result"] for d in post.data]
+        assert results == ["passed", "failed", "skipped"]
+
+    def test_post_batch_payload(self) -> None:
+        session = MagicMock()
+        _post_batch(
+            "https://analytics-api.buildkite.com/v1/uploads",
+            "fake-token",
+            b'{"CI":"generic","key":""}',
+            [{"id": "1", "result": "passed"}],
+            session=session,
+        )
+        url, body, headers = session.post.call_args[0]
+        assert url == "https://analytics-api.buildkite.com/v1/uploads"
+        assert json.loads(body) == {
+            "format": "json",
+            "run_env": {"CI": "generic", "key": ""},
+            "data": [{"id": "1", "result": "passed"}],
+        }
+        assert headers["Authorization"] == 'Token token="fake-token"'
 
     def test_http_error_resilience(
         self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
@@ -279,11 +395,6 @@ class TestBuildkiteUpload:
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
         backend = BuildkiteBackend()
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
         def raise_http_error(*args: object, **kwargs: object) -> None:
             raise urllib.error.HTTPError(
                 "http://example.com", 422, "Unprocessable", {}, None  # type: ignore[arg-type]
@@ -300,13 +411,15 @@ class TestBuildkiteUpload:
             ),
         ]
         with (
-            patch("urllib.request.urlopen", side_effect=raise_http_error),
+            patch.object(HttpSession, "post", side_effect=raise_http_error),
             caplog.at_level(logging.WARNING),
         ):
             backend.upload(events)
         assert "Buildkite upload failed" in caplog.text
 
-    def test_batching(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_batching(
+        self, monkeypatch: pytest.MonkeyPatch, buildkite_posts: list[_BuildkitePost]
+    ) -> None:
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
         backend = BuildkiteBackend()
         events: list[TestEvent] = [
@@ -320,17 +433,29 @@ class TestBuildkiteUpload:
             )
             for i in range(250)
         ]
-        with patch(
-            "bridle.backends._buildkite._post_batch"
-        ) as mock_post:
-            backend.upload(events)
-            assert mock_post.call_count == 3
-            # First two batches have 100 items, last has 50.
-            batch_sizes = [len(call.args[3]) for call in mock_post.call_args_list]
-            assert batch_sizes == [100, 100, 50]
+        backend.upload(events)
+        # Two batches have 100 items, one has 50 (posted concurrently,
+        # so call order is not fixed).
+        batch_sizes = [len(post.data) for post in buildkite_posts]
+        assert sorted(batch_sizes) == [50, 100, 100]
+
+    def test_entry_ids_unique_uuids(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_results: list[TestFinished],
+        buildkite_posts: list[_BuildkitePost],
+    ) -> None:
+        monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
+        backend = BuildkiteBackend()
+        backend.upload(sample_results)
+        ids = [d["id"] for d in buildkite_posts[0].data]
+        assert len(set(ids)) == len(sample_results)
+        for entry_id in ids:
+            assert uuid.UUID(entry_id).version == 4
+            assert str(uuid.UUID(entry_id)) == entry_id
 
     def test_crash_events_become_failed(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, monkeypatch: pytest.MonkeyPatch, buildkite_posts: list[_BuildkitePost]
     ) -> None:
         """Unmatched TestStarted events are resolved as failed."""
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
@@ -341,17 +466,28 @@ class TestBuildkiteUpload:
                 start=FIXED_START,
             ),
         ]
-        with patch(
-            "bridle.backends._buildkite._post_batch"
-        ) as mock_post:
-            backend.upload(events)
-            mock_post.assert_called_once()
-            data = mock_post.call_args[0][3]
-            assert len(data) == 1
-            assert data[0]["result"] == "failed"
-            assert data[0]["name"] == "test_crash"
+        backend.upload(events)
+        [post] = buildkite_posts
+        [entry] = post.data
+        assert entry["result"] == "failed"
+        assert entry["name"] == "test_crash"
+
+    def test_uses_provided_resolved(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_results: list[TestFinished],
+        buildkite_posts: list[_BuildkitePost],
+    ) -> None:
+        monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
+        backend = BuildkiteBackend()
+        with patch("bridle.backends._buildkite.resolve_events") as mock_resolve:
+            backend.upload(sample_results, resolved=sample_results)
+            mock_resolve.assert_not_called()
+        assert len(buildkite_posts[0].data) == 3
 
-    def test_custom_api_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_custom_api_url(
+        self, monkeypatch: pytest.MonkeyPatch, buildkite_posts: list[_BuildkitePost]
+    ) -> None:
         monkeypatch.setenv("BUILDKITE_ANALYTICS_TOKEN", "fake-token")
         monkeypatch.setenv(
             "BUILDKITE_ANALYTICS_API_URL", "https://custom.example.com/upload"
@@ -367,11 +503,98 @@ class TestBuildkiteUpload:
                 stop=FIXED_START,
             ),
         ]
-        with patch(
-            "bridle.backends._buildkite._post_batch"
-        ) as mock_post:
-            backend.upload(events)
-            assert mock_post.call_args[0][0] == "https://custom.example.com/upload"
+        backend.upload(events)
+        assert buildkite_posts[0].api_url == "https://custom.example.com/upload"
+
+
+class _Request(NamedTuple):
+    client_port: int
+    path: str
+    headers: Message
+    body: bytes
+
+
+class _RecordingServer(ThreadingHTTPServer):
+    requests: list[_Request]
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RecordingHandler)
+        self.requests = []
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Records a _Request per POST; /error paths return 500."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: _RecordingServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(
+            _Request(self.client_address[1], self.path, self.headers, body)
+        )
+        status = 500 if self.path.startswith("/error") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def local_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[_RecordingServer]:
+    for var in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    server = _RecordingServer()
+    # shutdown() waits for the serve loop to notice, which takes up to one
+    # poll_interval; the default 0.5s would dominate each test.
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _mslci_url(server: _RecordingServer) -> str:
+    return f"http://127.0.0.1:{server.server_port}/api/v1/uploads"
+
+
+class TestHttpSession:
+    def test_reuses_connection(self, local_server: _RecordingServer) -> None:
+        url = f"http://127.0.0.1:{local_server.server_port}/upload?x=1"
+        with HttpSession() as session:
+            assert session.post(url, b"one", {}) == b"ok"
+            assert session.post(url, b"two", {}) == b"ok"
+        requests = local_server.requests
+        assert [(r.path, r.body) for r in requests] == [
+            ("/upload?x=1", b"one"),
+            ("/upload?x=1", b"two"),
+        ]
+        # Both requests arrived over the same client connection.
+        assert requests[0].client_port == requests[1].client_port
+
+    def test_error_status_raises_http_error(
+        self, local_server: _RecordingServer
+    ) -> None:
+        url = f"http://127.0.0.1:{local_server.server_port}/error"
+        with HttpSession() as session, pytest.raises(urllib.error.HTTPError) as info:
+            session.post(url, b"{}", {})
+        assert info.value.code == 500
+
+    def test_connection_refused_raises_url_error(
+        self, local_server: _RecordingServer
+    ) -> None:
+        port = local_server.server_port
+        local_server.shutdown()
+        local_server.server_close()
+        with HttpSession() as session, pytest.raises(urllib.error.URLError):
+            session.post(f"http://127.0.0.1:{port}/", b"{}", {})
 
 
 class TestMslciBackend:
@@ -387,29 +610,25 @@ class TestMslciBackend:
     def test_empty_events_no_upload(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
         backend = MslciBackend()
-        with patch("urllib.request.urlopen") as mock_urlopen:
+        with patch.object(HttpSession, "post") as mock_post:
             backend.upload([])
-            mock_urlopen.assert_not_called()
+            mock_post.assert_not_called()
 
     def test_payload_structure(
-        self, monkeypatch: pytest.MonkeyPatch, sample_results: list[TestFinished]
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        local_server: _RecordingServer,
+        sample_results: list[TestFinished],
     ) -> None:
-        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        monkeypatch.setenv("MSLCI_API_URL", _mslci_url(local_server))
         monkeypatch.setenv("BUILDKITE_BUILD_ID", "abc-123")
         monkeypatch.setenv("BUILDKITE_BRANCH", "main")
         monkeypatch.setenv("BUILDKITE_COMMIT", "deadbeef")
         backend = MslciBackend()
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
-            backend.upload(sample_results)
-            mock_urlopen.assert_called_once()
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
+        backend.upload(sample_results)
+        [request] = local_server.requests
+        payload = json.loads(request.body)
 
         # Verify run_env has MSLCI schema fields
         run_env = payload["run_env"]
@@ -432,8 +651,10 @@ class TestMslciBackend:
         for ev in events:
             assert "type" not in ev
 
-    def test_auth_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+    def test_auth_header(
+        self, monkeypatch: pytest.MonkeyPatch, local_server: _RecordingServer
+    ) -> None:
+        monkeypatch.setenv("MSLCI_API_URL", _mslci_url(local_server))
         monkeypatch.setenv("MSLCI_API_TOKEN", "secret-token")
         backend = MslciBackend()
 
@@ -448,18 +669,14 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
-            backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            assert req.get_header("Authorization") == 'Token token="secret-token"'
+        backend.upload(events)
+        [request] = local_server.requests
+        assert request.headers["Authorization"] == 'Token token="secret-token"'
 
-    def test_no_auth_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+    def test_no_auth_header(
+        self, monkeypatch: pytest.MonkeyPatch, local_server: _RecordingServer
+    ) -> None:
+        monkeypatch.setenv("MSLCI_API_URL", _mslci_url(local_server))
         monkeypatch.delenv("MSLCI_API_TOKEN", raising=False)
         backend = MslciBackend()
 
@@ -474,15 +691,9 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
-            backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            assert not req.has_header("Authorization")
+        backend.upload(events)
+        [request] = local_server.requests
+        assert "Authorization" not in request.headers
 
     def test_http_error_resilience(
         self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
@@ -507,17 +718,99 @@ class TestMslciBackend:
             )
 
         with (
-            patch("urllib.request.urlopen", side_effect=raise_http_error),
+            patch.object(HttpSession, "post", side_effect=raise_http_error),
             caplog.at_level(logging.WARNING),
         ):
             backend.upload(events)
         assert "MSLCI upload failed" in caplog.text
 
-    def test_crash_events_resolved(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Unmatched TestStarted events are resolved as failed."""
+    def test_connection_error_retried(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        backend = MslciBackend()
+
+        events: list[TestEvent] = [
+            TestFinished(
+                nodeid="tests/test_a.py::test_ok",
+                outcome=Outcome.PASSED,
+                when="call",
+                duration=0.0,
+                start=FIXED_START,
+                stop=FIXED_START,
+            ),
+        ]
+
+        with (
+            patch.object(
+                HttpSession,
+                "post",
+                side_effect=[urllib.error.URLError(ConnectionResetError()), b""],
+            ) as mock_post,
+            patch("bridle.backends._mslci.time.sleep") as mock_sleep,
+            caplog.at_level(logging.WARNING),
+        ):
+            backend.upload(events)
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once()
+        assert "MSLCI upload failed" not in caplog.text
+
+    def test_read_timeout_not_retried(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """The server may have accepted a batch whose reply timed out."""
+        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        backend = MslciBackend()
+
+        events: list[TestEvent] = [
+            TestFinished(
+                nodeid="tests/test_a.py::test_ok",
+                outcome=Outcome.PASSED,
+                when="call",
+                duration=0.0,
+                start=FIXED_START,
+                stop=FIXED_START,
+            ),
+        ]
+
+        error = urllib.error.URLError(TimeoutError("timed out"))
+        with (
+            patch.object(HttpSession, "post", side_effect=error) as mock_post,
+            caplog.at_level(logging.WARNING),
+        ):
+            backend.upload(events)
+        assert mock_post.call_count == 1
+        assert "MSLCI upload failed" in caplog.text
+
+    def test_http_error_not_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
         backend = MslciBackend()
 
+        events: list[TestEvent] = [
+            TestFinished(
+                nodeid="tests/test_a.py::test_ok",
+                outcome=Outcome.PASSED,
+                when="call",
+                duration=0.0,
+                start=FIXED_START,
+                stop=FIXED_START,
+            ),
+        ]
+
+        error = urllib.error.HTTPError(
+            "http://example.com", 422, "Unprocessable", {}, None  # type: ignore[arg-type]
+        )
+        with patch.object(HttpSession, "post", side_effect=error) as mock_post:
+            backend.upload(events)
+        assert mock_post.call_count == 1
+
+    def test_crash_events_resolved(
+        self, monkeypatch: pytest.MonkeyPatch, local_server: _RecordingServer
+    ) -> None:
+        """Unmatched TestStarted events are resolved as failed."""
+        monkeypatch.setenv("MSLCI_API_URL", _mslci_url(local_server))
+        backend = MslciBackend()
+
         events: list[TestEvent] = [
             TestStarted(
                 nodeid="tests/test_a.py::test_crash",
@@ -525,56 +818,74 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
+        backend.upload(events)
+        [request] = local_server.requests
+        events_data = json.loads(request.body)["events"]
+        assert len(events_data) == 1
+        assert events_data[0]["outcome"] == "failed"
+        assert events_data[0]["nodeid"] == "tests/test_a.py::test_crash"
 
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
-            backend.upload(events)
-            mock_urlopen.assert_called_once()
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
-            events_data = payload["events"]
-            assert len(events_data) == 1
-            assert events_data[0]["outcome"] == "failed"
-            assert events_data[0]["nodeid"] == "tests/test_a.py::test_crash"
-
-    def test_batching(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_batching(self) -> None:
+        # Two batches of 5000 items and one of 2000. Batching only looks at
+        # the encoded bytes, so the events needn't be real.
+        batch_sizes = [len(b) for b in _batches([b"{}"] * 12_000)]
+        assert batch_sizes == [5000, 5000, 2000]
+
+    def test_batching_by_bytes(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        monkeypatch.setattr("bridle.backends._mslci._MAX_BATCH_BYTES", 10_000)
         backend = MslciBackend()
         events: list[TestEvent] = [
             TestFinished(
                 nodeid=f"tests/test_a.py::test_{i}",
-                outcome=Outcome.PASSED,
+                outcome=Outcome.FAILED,
                 when="call",
                 duration=0.0,
                 start=FIXED_START,
                 stop=FIXED_START,
+                longrepr="x" * 3000,
             )
-            for i in range(12_000)
+            for i in range(10)
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
+        with patch.object(HttpSession, "post", return_value=b"") as mock_post:
+            backend.upload(events)
+            payloads = [json.loads(call.args[1]) for call in mock_post.call_args_list]
+
+        # Three ~3KB events fit under the 10KB limit; a fourth would not.
+        assert sorted(len(p["events"]) for p in payloads) == [1, 3, 3, 3]
+        nodeids = sorted(ev["nodeid"] for p in payloads for ev in p["events"])
+        assert nodeids == sorted(ev.nodeid for ev in events)
 
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
+    def test_compress_env_var(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MSLCI_COMPRESS=1 gzips the request body."""
+        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        monkeypatch.setenv("MSLCI_COMPRESS", "1")
+        backend = MslciBackend()
+
+        events: list[TestEvent] = [
+            TestFinished(
+                nodeid="tests/test_a.py::test_ok",
+                outcome=Outcome.PASSED,
+                when="call",
+                duration=0.0,
+                start=FIXED_START,
+                stop=FIXED_START,
+            ),
+        ]
+
+        with patch.object(HttpSession, "post", return_value=b"") as mock_post:
             backend.upload(events)
-            assert mock_urlopen.call_count == 3
-            # First two batches have 5000 items, last has 2000.
-            batch_sizes = [
-                len(json.loads(call.args[0].data.decode("utf-8"))["events"])
-                for call in mock_urlopen.call_args_list
-            ]
-            assert batch_sizes == [5000, 5000, 2000]
+            _, body, headers = mock_post.call_args[0]
+            assert headers["Content-Encoding"] == "gzip"
+            payload = json.loads(gzip.decompress(body))
+            assert payload["events"][0]["nodeid"] == "tests/test_a.py::test_ok"
 
     def test_run_env_commit_sha_mapping(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, monkeypatch: pytest.MonkeyPatch, local_server: _RecordingServer
     ) -> None:
         """The 'commit' field from CI detection is mapped to 'commit_sha'."""
-        monkeypatch.setenv("MSLCI_API_URL", "https://mslci.example.com/api/v1/uploads")
+        monkeypatch.setenv("MSLCI_API_URL", _mslci_url(local_server))
         monkeypatch.delenv("BUILDKITE_BUILD_ID", raising=False)
         monkeypatch.setenv("GITHUB_ACTION", "run")
         monkeypatch.setenv("GITHUB_RUN_ID", "999")
@@ -596,18 +907,11 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
-            backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
-            run_env = payload["run_env"]
-            assert run_env["commit_sha"] == "deadbeef"
-            assert "commit" not in run_env
+        backend.upload(events)
+        [request] = local_server.requests
+        run_env = json.loads(request.body)["run_env"]
+        assert run_env["commit_sha"] == "deadbeef"
+        assert "commit" not in run_env
 
     def test_default_includes_all_fields(
         self, monkeypatch: pytest.MonkeyPatch
@@ -631,15 +935,9 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
+        with patch.object(HttpSession, "post", return_value=b"") as mock_post:
             backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
+            payload = json.loads(mock_post.call_args[0][1])
             ev = payload["events"][0]
             assert "longrepr" in ev
             assert "sections" in ev
@@ -667,15 +965,9 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
+        with patch.object(HttpSession, "post", return_value=b"") as mock_post:
             backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
+            payload = json.loads(mock_post.call_args[0][1])
             ev = payload["events"][0]
             assert "longrepr" not in ev
             assert "sections" not in ev
@@ -707,15 +999,9 @@ class TestMslciBackend:
             ),
         ]
 
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b""
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_urlopen:
+        with patch.object(HttpSession, "post", return_value=b"") as mock_post:
             backend.upload(events)
-            req = mock_urlopen.call_args[0][0]
-            payload = json.loads(req.data.decode("utf-8"))
+            payload = json.loads(mock_post.call_args[0][1])
             ev = payload["events"][0]
             assert "longrepr" not in ev
             assert "sections" in ev
@@ -1,148 +1,138 @@
 from __future__ import annotations
 
-import os
+import shutil
 import subprocess
 import sys
-import textwrap
+from collections.abc import Callable
+from pathlib import Path
 
 import pytest
 
+from bridle._harness import run
 
-class TestHarnessSubprocess:
-    """Full subprocess integration tests for the bridle CLI."""
-
-    def test_passing_tests(self, tmp_path) -> None:
-        test_file = tmp_path / "test_example.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            def test_one():
-                assert True
-
-            def test_two():
-                assert 1 + 1 == 2
-        """)
-        )
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(test_file), "--backend", "stub"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "passed" in result.stderr.lower()
-
-    def test_failing_tests_nonzero_exit(self, tmp_path) -> None:
-        test_file = tmp_path / "test_fail.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            def test_bad():
-                assert False
-        """)
-        )
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(test_file), "--backend", "stub"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
-        assert "failed" in result.stderr.lower()
 
-    def test_mixed_outcomes(self, tmp_path) -> None:
-        test_file = tmp_path / "test_mixed.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            import pytest
+def _run_bridle(capsys: pytest.CaptureFixture[str], *args: str) -> tuple[int, str]:
+    """Run the bridle CLI in-process and return (exit code, stderr).
 
-            def test_pass():
-                assert True
+    pytest itself still runs in a subprocess; this only skips starting a
+    second interpreter for the harness.
+    """
+    exit_code = run(list(args))
+    return exit_code, capsys.readouterr().err
 
-            def test_fail():
-                assert False
 
-            @pytest.mark.skip
-            def test_skip():
-                pass
-        """)
-        )
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(test_file), "--backend", "stub"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
-        stderr_lower = result.stderr.lower()
+_FIXTURES = Path(__file__).parent / "fixtures" / "integration"
+
+
+@pytest.fixture()
+def copy_fixture(tmp_path: Path) -> Callable[[str], Path]:
+    """Copy a test module from tests/fixtures/integration into tmp_path."""
+
+    def _copy(name: str) -> Path:
+        return Path(shutil.copy(_FIXTURES / name, tmp_path / f"test_{name}"))
+
+    return _copy
+
+
+class TestHarnessSubprocess:
+    """Full integration tests for the bridle CLI."""
+
+    def test_passing_tests(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("passing.py")
+        exit_code, stderr = _run_bridle(capsys, str(test_file), "--backend", "stub")
+        assert exit_code == 0
+        assert "passed" in stderr.lower()
+
+    def test_failing_tests_nonzero_exit(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("failing.py")
+        exit_code, stderr = _run_bridle(capsys, str(test_file), "--backend", "stub")
+        assert exit_code != 0
+        assert "failed" in stderr.lower()
+
+    def test_mixed_outcomes(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("mixed.py")
+        exit_code, stderr = _run_bridle(capsys, str(test_file), "--backend", "stub")
+        assert exit_code != 0
+        stderr_lower = stderr.lower()
         assert "passed" in stderr_lower
         assert "failed" in stderr_lower
         assert "skipped" in stderr_lower
 
-    def test_no_test_files(self, tmp_path) -> None:
+    def test_no_test_files(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Running with a directory that has no tests should still work."""
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(empty_dir), "--backend", "stub"],
-            capture_output=True,
-            text=True,
-        )
+        exit_code, stderr = _run_bridle(capsys, str(empty_dir), "--backend", "stub")
         # pytest returns 5 (no tests collected) — we pass it through.
-        assert result.returncode == 5
+        assert exit_code == 5
 
-    def test_stub_backend_message(self, tmp_path) -> None:
-        test_file = tmp_path / "test_one.py"
-        test_file.write_text("def test_ok(): pass\n")
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(test_file), "--backend", "stub"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "would upload" in result.stderr.lower()
+    def test_stub_backend_message(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("single.py")
+        exit_code, stderr = _run_bridle(capsys, str(test_file), "--backend", "stub")
+        assert exit_code == 0
+        assert "would upload" in stderr.lower()
 
 
 class TestMultipleBackends:
     """Integration tests for comma-separated --backend values."""
 
-    def test_multiple_stub_backends(self, tmp_path) -> None:
-        test_file = tmp_path / "test_one.py"
-        test_file.write_text("def test_ok(): pass\n")
-        result = subprocess.run(
-            [sys.executable, "-m", "bridle", str(test_file), "--backend", "stub,stub"],
-            capture_output=True,
-            text=True,
+    def test_duplicate_backends_upload_once(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("single.py")
+        exit_code, stderr = _run_bridle(
+            capsys, str(test_file), "--backend", "stub,stub"
         )
-        assert result.returncode == 0
-        # Both stub backends should print their "would upload" message.
-        assert result.stderr.lower().count("would upload") == 2
+        assert exit_code == 0
+        # Repeated names are deduplicated, so the stub uploads only once.
+        assert stderr.lower().count("would upload") == 1
 
 
 class TestPythonFlag:
     """Integration tests for --python flag."""
 
-    def test_python_flag_with_current_interpreter(self, tmp_path) -> None:
+    def test_python_flag_with_current_interpreter(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Using --python with the current interpreter should work end-to-end."""
-        test_file = tmp_path / "test_example.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            def test_ok():
-                assert True
-        """)
-        )
-        result = subprocess.run(
-            [
-                sys.executable, "-m", "bridle",
-                str(test_file),
-                "--python", sys.executable,
-                "--backend", "stub",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "passed" in result.stderr.lower()
-
-    def test_python_flag_invalid_path(self, tmp_path) -> None:
+        test_file = copy_fixture("single.py")
+        exit_code, stderr = _run_bridle(
+            capsys,
+            str(test_file),
+            "--python", sys.executable,
+            "--backend", "stub",
+        )
+        assert exit_code == 0
+        assert "passed" in stderr.lower()
+
+    def test_python_flag_invalid_path(
+        self, copy_fixture: Callable[[str], Path]
+    ) -> None:
         """Using --python with a non-existent path should fail."""
-        test_file = tmp_path / "test_example.py"
-        test_file.write_text("def test_ok(): pass\n")
+        test_file = copy_fixture("single.py")
+        # Run the real CLI: this checks the process exit status end-to-end.
         result = subprocess.run(
             [
                 sys.executable, "-m", "bridle",
@@ -159,75 +149,48 @@ class TestPythonFlag:
 class TestHarnessTimeouts:
     """Integration tests for --test-timeout-sec and --total-timeout-sec."""
 
-    def test_per_test_timeout_kills_slow_test(self, tmp_path) -> None:
-        test_file = tmp_path / "test_slow.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            import time
-            def test_hangs():
-                time.sleep(60)
-        """)
-        )
-        result = subprocess.run(
-            [
-                sys.executable, "-m", "bridle",
-                str(test_file),
-                "--test-timeout-sec", "2",
-                "--backend", "stub",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert result.returncode != 0
-        assert "timeout" in result.stderr.lower()
-
-    def test_total_timeout_kills_run(self, tmp_path) -> None:
-        test_file = tmp_path / "test_many_slow.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            import time
-            def test_a():
-                time.sleep(60)
-            def test_b():
-                time.sleep(60)
-        """)
-        )
-        result = subprocess.run(
-            [
-                sys.executable, "-m", "bridle",
-                str(test_file),
-                "--total-timeout-sec", "3",
-                "--backend", "stub",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert result.returncode != 0
-        assert "timeout" in result.stderr.lower()
-
-    def test_no_timeout_when_tests_are_fast(self, tmp_path) -> None:
-        test_file = tmp_path / "test_fast.py"
-        test_file.write_text(
-            textwrap.dedent("""\
-            def test_quick_a():
-                assert True
-            def test_quick_b():
-                assert 1 + 1 == 2
-        """)
-        )
-        result = subprocess.run(
-            [
-                sys.executable, "-m", "bridle",
-                str(test_file),
-                "--test-timeout-sec", "30",
-                "--total-timeout-sec", "60",
-                "--backend", "stub",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert result.returncode == 0
-        assert "passed" in result.stderr.lower()
+    def test_per_test_timeout_kills_slow_test(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("hangs.py")
+        exit_code, stderr = _run_bridle(
+            capsys,
+            str(test_file),
+            "--test-timeout-sec", "2",
+            "--backend", "stub",
+        )
+        assert exit_code != 0
+        assert "timeout" in stderr.lower()
+
+    def test_total_timeout_kills_run(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("many_slow.py")
+        exit_code, stderr = _run_bridle(
+            capsys,
+            str(test_file),
+            "--total-timeout-sec", "3",
+            "--backend", "stub",
+        )
+        assert exit_code != 0
+        assert "timeout" in stderr.lower()
+
+    def test_no_timeout_when_tests_are_fast(
+        self,
+        copy_fixture: Callable[[str], Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        test_file = copy_fixture("passing.py")
+        exit_code, stderr = _run_bridle(
+            capsys,
+            str(test_file),
+            "--test-timeout-sec", "30",
+            "--total-timeout-sec", "60",
+            "--backend", "stub",
+        )
+        assert exit_code == 0
+        assert "passed" in stderr.lower()
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+import time
 from pathlib import Path
 
+import pytest
+
 from bridle._monitor import (
     Clock,
+    EventReader,
     Process,
     TimeoutResult,
+    _PidfdWait,
+    _Tail,
     monitor_subprocess,
 )
 from bridle._schema import (
@@ -14,13 +23,14 @@ from bridle._schema import (
     TestFinished,
     TestStarted,
     append_event,
+    append_events,
     read_events,
     resolve_events,
     test_timeout_repr as _test_timeout_repr,
     total_timeout_repr as _total_timeout_repr,
 )
 
-from conftest import FIXED_START
+from conftest import FIXED_START, FIXED_STOP
 
 
 # ---------------------------------------------------------------------------
@@ -28,19 +38,23 @@ from conftest import FIXED_START
 # ---------------------------------------------------------------------------
 
 class MockClock:
-    """Clock with manually controlled time."""
+    """Clock with manually controlled time.
+
+    Time is kept in integer nanoseconds so that repeated small sleeps add up
+    exactly (ten 0.1s sleeps are exactly 1.0s) at timeout boundaries.
+    """
 
     def __init__(self, start: float = 0.0) -> None:
-        self._now = start
+        self._now_ns = round(start * 1e9)
 
     def monotonic(self) -> float:
-        return self._now
+        return self._now_ns / 1e9
 
     def sleep(self, seconds: float) -> None:
-        self._now += seconds
+        self._now_ns += round(seconds * 1e9)
 
     def advance(self, seconds: float) -> None:
-        self._now += seconds
+        self._now_ns += round(seconds * 1e9)
 
 
 class MockProcess:
@@ -70,9 +84,10 @@ class MockProcess:
     def poll(self) -> int | None:
         self._poll_count += 1
 
-        # Write scheduled events for this poll iteration.
-        for event in self._scheduled_events.get(self._poll_count, []):
-            append_event(self._results_path, event)
+        # Write scheduled events for this poll iteration in one append.
+        events = self._scheduled_events.get(self._poll_count)
+        if events:
+            append_events(self._results_path, events)
 
         if self._killed:
             return -9
@@ -86,9 +101,15 @@ class MockProcess:
         self._killed = True
 
     def wait(self, timeout: float | None = None) -> int:
-        if self._killed:
-            return -9
-        return self._exit_code
+        return -9 if self._killed else self._exit_code
+
+
+@pytest.fixture()
+def results_file(tmp_path: Path) -> Path:
+    """An empty results file for the monitor to tail."""
+    path = tmp_path / "results.jsonl"
+    path.touch()
+    return path
 
 
 # ---------------------------------------------------------------------------
@@ -97,47 +118,33 @@ class MockProcess:
 
 
 class TestMonitorNormalExit:
-    def test_returns_exit_code_no_timeout(self, tmp_path: Path) -> None:
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
-        clock = MockClock()
-        proc = MockProcess(results)
-        proc.schedule_exit(after_polls=2, exit_code=0)
-
-        exit_code, timeout = monitor_subprocess(
-            proc,
-            results,
-            clock=clock,
-            poll_interval=0.1,
-        )
-        assert exit_code == 0
-        assert timeout is None
-
-    def test_nonzero_exit_code(self, tmp_path: Path) -> None:
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
+    @pytest.mark.parametrize(
+        ("after_polls", "exit_code"),
+        [
+            pytest.param(2, 0, id="zero"),
+            pytest.param(1, 1, id="nonzero"),
+        ],
+    )
+    def test_returns_exit_code(
+        self, results_file: Path, after_polls: int, exit_code: int
+    ) -> None:
         clock = MockClock()
-        proc = MockProcess(results)
-        proc.schedule_exit(after_polls=1, exit_code=1)
+        proc = MockProcess(results_file)
+        proc.schedule_exit(after_polls=after_polls, exit_code=exit_code)
 
-        exit_code, timeout = monitor_subprocess(
+        result, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             clock=clock,
             poll_interval=0.1,
         )
-        assert exit_code == 1
+        assert result == exit_code
         assert timeout is None
 
 
 class TestMonitorNoTimeoutArgs:
-    def test_no_timeout_still_works(self, tmp_path: Path) -> None:
+    def test_no_timeout_still_works(self, results_file: Path) -> None:
         """Monitor with no timeout args just polls until process exits."""
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
         started = TestStarted(nodeid="t::a", start=FIXED_START)
         finished = TestFinished(
             nodeid="t::a",
@@ -149,14 +156,14 @@ class TestMonitorNoTimeoutArgs:
         )
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         proc.schedule_events(1, [started])
         proc.schedule_events(2, [finished])
         proc.schedule_exit(after_polls=3, exit_code=0)
 
         exit_code, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             clock=clock,
             poll_interval=1.0,
         )
@@ -165,10 +172,7 @@ class TestMonitorNoTimeoutArgs:
 
 
 class TestMonitorPerTestTimeout:
-    def test_slow_test_is_killed(self, tmp_path: Path) -> None:
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
+    def test_slow_test_is_killed(self, results_file: Path) -> None:
         started = TestStarted(
             nodeid="t::slow",
             start=FIXED_START,
@@ -176,7 +180,7 @@ class TestMonitorPerTestTimeout:
         )
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         # Poll 1: test starts
         proc.schedule_events(1, [started])
         # Process never exits on its own
@@ -184,7 +188,7 @@ class TestMonitorPerTestTimeout:
 
         exit_code, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             test_timeout_sec=5.0,
             clock=clock,
             poll_interval=2.0,  # each sleep advances 2s
@@ -192,26 +196,25 @@ class TestMonitorPerTestTimeout:
 
         # After poll 1 (time=0): read started, check timeout (elapsed=0), sleep 2s -> time=2
         # After poll 2 (time=2): no new events, check timeout (elapsed=2), sleep 2s -> time=4
-        # After poll 3 (time=4): no new events, check timeout (elapsed=4), sleep 2s -> time=6
-        # After poll 4 (time=6): elapsed=6 >= 5, timeout fires
+        # After poll 3 (time=4): no new events, check timeout (elapsed=4), sleep
+        #   only until the deadline -> time=5
+        # After poll 4 (time=5): elapsed=5 >= 5, timeout fires
         assert timeout is not None
         assert timeout.kind == "test"
         assert timeout.nodeid == "t::slow"
         assert timeout.limit == 5.0
+        assert timeout.elapsed == 5.0
 
         # Check that a TestFinished was written to the JSONL.
-        events = read_events(results)
-        finished_events = [e for e in events if isinstance(e, TestFinished)]
+        events = read_events(results_file)
+        finished_events = [e for e in events if e.type == "test_finished"]
         assert len(finished_events) == 1
         assert finished_events[0].nodeid == "t::slow"
         assert finished_events[0].outcome == Outcome.FAILED
         assert "per-test timeout" in (finished_events[0].longrepr or "")
         assert finished_events[0].location == ("test.py", 10, "t::slow")
 
-    def test_fast_test_is_not_killed(self, tmp_path: Path) -> None:
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
+    def test_fast_test_is_not_killed(self, results_file: Path) -> None:
         started = TestStarted(nodeid="t::fast", start=FIXED_START)
         finished = TestFinished(
             nodeid="t::fast",
@@ -223,14 +226,14 @@ class TestMonitorPerTestTimeout:
         )
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         proc.schedule_events(1, [started])
         proc.schedule_events(2, [finished])
         proc.schedule_exit(after_polls=3, exit_code=0)
 
         exit_code, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             test_timeout_sec=10.0,
             clock=clock,
             poll_interval=0.5,
@@ -240,10 +243,7 @@ class TestMonitorPerTestTimeout:
 
 
 class TestMonitorTotalTimeout:
-    def test_total_timeout_kills(self, tmp_path: Path) -> None:
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
+    def test_total_timeout_kills(self, results_file: Path) -> None:
         started = TestStarted(
             nodeid="t::a",
             start=FIXED_START,
@@ -251,13 +251,13 @@ class TestMonitorTotalTimeout:
         )
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         proc.schedule_events(1, [started])
         proc.schedule_exit(after_polls=999)
 
         exit_code, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             total_timeout_sec=3.0,
             clock=clock,
             poll_interval=1.0,
@@ -271,28 +271,25 @@ class TestMonitorTotalTimeout:
         assert timeout.kind == "total"
         assert timeout.limit == 3.0
 
-        events = read_events(results)
-        finished_events = [e for e in events if isinstance(e, TestFinished)]
+        events = read_events(results_file)
+        finished_events = [e for e in events if e.type == "test_finished"]
         assert len(finished_events) == 1
         assert "total run exceeded timeout" in (finished_events[0].longrepr or "")
 
 
 class TestMonitorBothTimeouts:
-    def test_per_test_fires_before_total(self, tmp_path: Path) -> None:
+    def test_per_test_fires_before_total(self, results_file: Path) -> None:
         """When both are set, per-test fires first if a single test hangs."""
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
         started = TestStarted(nodeid="t::hang", start=FIXED_START)
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         proc.schedule_events(1, [started])
         proc.schedule_exit(after_polls=999)
 
         exit_code, timeout = monitor_subprocess(
             proc,
-            results,
+            results_file,
             test_timeout_sec=5.0,
             total_timeout_sec=100.0,
             clock=clock,
@@ -304,12 +301,9 @@ class TestMonitorBothTimeouts:
 
 
 class TestMonitorResolveIntegration:
-    def test_timeout_events_integrate_with_resolve(self, tmp_path: Path) -> None:
+    def test_timeout_events_integrate_with_resolve(self, results_file: Path) -> None:
         """Monitor-written TestFinished events are processed by resolve_events
         without producing crash reprs."""
-        results = tmp_path / "results.jsonl"
-        results.touch()
-
         started = TestStarted(
             nodeid="t::timeout",
             start=FIXED_START,
@@ -317,19 +311,19 @@ class TestMonitorResolveIntegration:
         )
 
         clock = MockClock()
-        proc = MockProcess(results)
+        proc = MockProcess(results_file)
         proc.schedule_events(1, [started])
         proc.schedule_exit(after_polls=999)
 
         monitor_subprocess(
             proc,
-            results,
+            results_file,
             test_timeout_sec=3.0,
             clock=clock,
             poll_interval=1.0,
         )
 
-        events = read_events(results)
+        events = read_events(results_file)
         resolved = resolve_events(events)
 
         # Should have exactly one resolved result.
@@ -342,6 +336,119 @@ class TestMonitorResolveIntegration:
         assert "timeout" in (r.longrepr or "").lower()
 
 
+class TestTail:
+    def test_reads_only_new_complete_lines(self, tmp_path: Path) -> None:
+        results = tmp_path / "results.jsonl"
+        results.write_bytes(b'{"a": 1}\n{"b"')
+
+        tail = _Tail(results)
+        try:
+            assert list(tail.read_lines()) == [b'{"a": 1}']
+            # The partial line is held back until its newline arrives.
+            assert list(tail.read_lines()) == []
+            with results.open("ab") as f:
+                f.write(b': 2}\n{"c": 3}\n')
+            assert list(tail.read_lines()) == [b'{"b": 2}', b'{"c": 3}']
+        finally:
+            tail.close()
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        tail = _Tail(tmp_path / "nonexistent.jsonl")
+        assert list(tail.read_lines()) == []
+
+
+class TestEventReader:
+    def test_collects_events_written_while_running(self, results_file: Path) -> None:
+        started = TestStarted(nodeid="t::a", start=FIXED_START)
+        finished = TestFinished(
+            nodeid="t::a",
+            outcome=Outcome.PASSED,
+            when="call",
+            duration=0.001,
+            start=FIXED_START,
+            stop=FIXED_STOP,
+        )
+
+        reader = EventReader(results_file)
+        append_event(results_file, started)
+        assert reader.read_new() == [started]
+        assert reader.read_new() == []
+        with results_file.open("a") as f:
+            f.write("NOT JSON\n")
+        append_event(results_file, finished)
+        events = reader.finish()
+
+        assert events == [started, finished]
+
+    def test_parses_final_line_without_newline(self, tmp_path: Path) -> None:
+        results = tmp_path / "results.jsonl"
+        started = TestStarted(nodeid="t::a", start=FIXED_START)
+        results.write_text(started.model_dump_json())
+
+        reader = EventReader(results)
+        assert reader.finish() == [started]
+
+    def test_monitor_feeds_reader(self, results_file: Path) -> None:
+        """Events the monitor tails, including its own timeout records, end
+        up in the caller's reader."""
+        started = TestStarted(nodeid="t::slow", start=FIXED_START)
+
+        proc = MockProcess(results_file)
+        proc.schedule_events(1, [started])
+        proc.schedule_exit(after_polls=999)
+
+        reader = EventReader(results_file)
+        _, timeout = monitor_subprocess(
+            proc,
+            results_file,
+            test_timeout_sec=1.0,
+            reader=reader,
+            clock=MockClock(),
+            poll_interval=0.5,
+        )
+        assert timeout is not None
+        events = reader.finish()
+        assert [e.type for e in events] == ["test_started", "test_finished"]
+        assert events[0] == started
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "pidfd_open"), reason="requires os.pidfd_open (Linux)"
+)
+class TestPidfdWait:
+    def test_wakes_on_exit(self, results_file: Path) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        wait = _PidfdWait(proc.pid, results_file, poll_interval=60.0)
+        try:
+            t0 = time.monotonic()
+            wait.wait(None)
+            assert time.monotonic() - t0 < 30.0
+        finally:
+            wait.close()
+        assert proc.wait() == 0
+
+    def test_wakes_on_results_write(self, results_file: Path) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        wait = _PidfdWait(proc.pid, results_file, poll_interval=60.0)
+        try:
+            append_event(results_file, TestStarted(nodeid="t::a", start=FIXED_START))
+            t0 = time.monotonic()
+            wait.wait(None)
+            assert time.monotonic() - t0 < 30.0
+        finally:
+            wait.close()
+            proc.kill()
+            proc.wait()
+
+    def test_monitor_real_process(self, results_file: Path) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+        exit_code, timeout = monitor_subprocess(
+            proc, results_file, total_timeout_sec=30.0, poll_interval=60.0
+        )
+        assert exit_code == 3
+        assert timeout is None
+
+
 class TestTimeoutReprHelpers:
     def test_test_timeout_repr(self) -> None:
         s = _test_timeout_repr(10.0, 12.5)
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
+from bridle import _plugin
 from bridle._schema import Outcome, TestFinished, read_events, resolve_events
 
 
-@pytest.fixture()
-def harness_pytester(pytester: pytest.Pytester) -> pytest.Pytester:
-    """A pytester that registers the plugin via conftest, pointing at a local results file."""
-    results_file = pytester.path / "results.jsonl"
-    pytester.makeconftest(
-        f"""
+_CONFTEST_TEMPLATE = """
 from pathlib import Path
 from bridle._plugin import TestResultPlugin
 
 def pytest_configure(config):
-    plugin = TestResultPlugin(Path({str(results_file)!r}))
+    plugin = TestResultPlugin(Path({results_path!r}))
     config.pluginmanager.register(plugin, "bridle_plugin")
 """
-    )
+
+
+@pytest.fixture()
+def harness_pytester(pytester: pytest.Pytester) -> pytest.Pytester:
+    """A pytester that registers the plugin via conftest, pointing at a local results file."""
+    results_file = pytester.path / "results.jsonl"
+    pytester.makeconftest(_CONFTEST_TEMPLATE.format(results_path=str(results_file)))
     return pytester
 
 
@@ -216,10 +222,28 @@ def test_ok():
         )
         harness_pytester.runpytest()
 
-        from bridle._schema import TestStarted
-        events = read_events(harness_pytester.path / "results.jsonl")
-        started = [e for e in events if isinstance(e, TestStarted)]
-        finished = [e for e in events if isinstance(e, TestFinished)]
-        assert len(started) == 1
-        assert len(finished) == 1
-        assert started[0].nodeid == finished[0].nodeid
+        started, finished = read_events(harness_pytester.path / "results.jsonl")
+        assert started.type == "test_started"
+        assert finished.type == "test_finished"
+        assert started.nodeid == finished.nodeid
+
+
+class TestWrite:
+    def test_partial_writes_are_completed(self, tmp_path: Path) -> None:
+        """A short os.write() is retried until the whole line is written."""
+        real_write = os.write
+        plugin = _plugin.TestResultPlugin(tmp_path / "results.jsonl")
+        plugin.open()
+        try:
+            with patch(
+                "bridle._plugin.os.write",
+                side_effect=lambda fd, data: real_write(fd, data[:7]),
+            ):
+                plugin._write(
+                    {"type": "test_started", "nodeid": "t::a", "start": 1.0}
+                )
+        finally:
+            plugin.close()
+
+        [started] = read_events(tmp_path / "results.jsonl")
+        assert started.nodeid == "t::a"
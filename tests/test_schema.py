@@ -8,6 +8,7 @@ from bridle._schema import (
     Outcome,
     TestFinished,
     TestStarted,
+    append_events,
     read_events,
     resolve_events,
 )
@@ -66,6 +67,13 @@ class TestReadEvents:
         events = read_events(f)
         assert len(events) == 1
 
+    def test_skips_invalid_utf8_line(self, tmp_path) -> None:
+        f = tmp_path / "results.jsonl"
+        started = TestStarted(nodeid="t::a", start=FIXED_START)
+        f.write_bytes(b'{"nodeid": "\xff"}\n' + started.model_dump_json().encode() + b"\n")
+        events = read_events(f)
+        assert len(events) == 1
+
     def test_missing_file(self, tmp_path) -> None:
         events = read_events(tmp_path / "nonexistent.jsonl")
         assert events == []
@@ -77,6 +85,26 @@ class TestReadEvents:
         assert events == []
 
 
+class TestAppendEvents:
+    def test_appends_all_events(self, tmp_path) -> None:
+        f = tmp_path / "results.jsonl"
+        started = TestStarted(nodeid="t::a", start=FIXED_START)
+        f.write_text(started.model_dump_json() + "\n")
+        finished = [
+            TestFinished(
+                nodeid=nodeid,
+                outcome=Outcome.FAILED,
+                when="call",
+                duration=0.001,
+                start=FIXED_START,
+                stop=FIXED_STOP,
+            )
+            for nodeid in ("t::a", "t::b")
+        ]
+        append_events(f, finished)
+        assert read_events(f) == [started, *finished]
+
+
 class TestResolveEvents:
     def test_unmatched_start_becomes_crash(self, tmp_path) -> None:
         started = TestStarted(nodeid="t::crashed", start=FIXED_START, location=("test.py", 1, "t::crashed"))
@@ -120,3 +148,18 @@ class TestResolveEvents:
         assert resolved[1].nodeid == "t::b"
         assert resolved[1].outcome == Outcome.FAILED
         assert resolved[1].longrepr == CRASH_REPR
+
+    def test_crash_after_earlier_pass_is_reported(self) -> None:
+        """A rerun that crashes is reported even though an earlier run finished."""
+        started = TestStarted(nodeid="t::a", start=FIXED_START)
+        finished = TestFinished(
+            nodeid="t::a",
+            outcome=Outcome.FAILED,
+            when="call",
+            duration=0.001,
+            start=FIXED_START,
+            stop=FIXED_STOP,
+        )
+
+        resolved = resolve_events([started, finished, started])
+        assert [r.longrepr for r in resolved] == [None, CRASH_REPR]